@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the classic DDF loop against the Kaltofen-Shoup
+baby-step/giant-step DDF with Brent-Kung modular composition.
+
+Runs json/gfpoly_ddf.json, batches of small random monic polynomials and
+random monic polynomials of higher degree with both algorithms and checks
+that the results agree.
+
+Usage:
+    python3 benchmarks/bench_ddf.py [max_degree]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.polynom_perf import Polynom
+from tasks.gcm_pwn import ddf
+from common import _base64_to_poly
+
+
+def _run(polys, algorithm):
+    start = time.perf_counter()
+    results = [ddf(f, algorithm=algorithm) for f in polys]
+    return time.perf_counter() - start, results
+
+
+def _report(name, polys):
+    classic, expected = _run(polys, "classic")
+    bsgs, results = _run(polys, "bsgs")
+    assert results == expected, f"{name}: results differ"
+    print(f"{name:<26} classic {classic * 1000:9.1f} ms   bsgs {bsgs * 1000:9.1f} ms"
+          f"   speedup {classic / bsgs:5.2f}x")
+
+
+def main():
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    with open(os.path.join(ROOT, "json", "gfpoly_ddf.json"), "r") as file:
+        data = json.load(file)
+    corpus = [_base64_to_poly(test_case["arguments"]["F"]) for test_case in data["testcases"].values()
+              if test_case["action"] == "gfpoly_factor_ddf"]
+    _report("gfpoly_ddf.json", corpus)
+
+    random.seed(1)
+    # Small degrees, where DDF_BSGS_MIN_DEGREE switches between the two
+    for degree in (2, 3, 4, 6, 8, 16):
+        polys = [Polynom([random.getrandbits(128) for _ in range(degree)] + [1]) for _ in range(100)]
+        _report(f"100 x random degree {degree}", polys)
+
+    degree = 32
+    while degree <= max_degree:
+        polys = [Polynom([random.getrandbits(128) for _ in range(degree)] + [1]) for _ in range(2)]
+        _report(f"random degree {degree}", polys)
+        degree *= 2
+
+
+if __name__ == "__main__":
+    main()
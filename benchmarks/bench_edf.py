@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the EDF splitters: the trace map against h^((q^d - 1) / 3) - 1.
+
+Runs json/gfpoly_edf.json with both splitters and checks that the factors
+agree; the splitting polynomials are random, so each run is repeated.
+
+Usage:
+    python3 benchmarks/bench_edf.py [repeats]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.gcm_pwn import edf
+from common import _base64_to_poly
+
+
+def _run(cases, splitter, repeats):
+    random.seed(1)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        results = [[poly.int for poly in edf(f, d, splitter=splitter)] for f, d in cases]
+    return (time.perf_counter() - start) / repeats, results
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    with open(os.path.join(ROOT, "json", "gfpoly_edf.json"), "r") as file:
+        data = json.load(file)
+    cases = [(_base64_to_poly(test_case["arguments"]["F"]), test_case["arguments"]["d"])
+             for test_case in data["testcases"].values() if test_case["action"] == "gfpoly_factor_edf"]
+
+    power, expected = _run(cases, "power", repeats)
+    trace, results = _run(cases, "trace", repeats)
+    assert results == expected, "factors differ"
+    print(f"gfpoly_edf.json ({len(cases)} cases)   power {power * 1000:9.1f} ms   trace {trace * 1000:9.1f} ms"
+          f"   speedup {power / trace:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
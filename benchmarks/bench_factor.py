@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the factor pipeline against running its stages separately.
+
+Builds products of random polynomials with repeated factors and compares
+factor(), where ddf hands its Frobenius images X^(q^(2^i)) to edf, with
+sff, ddf and edf called one after the other, each computing its own
+powers. Both results must agree. Random products are dominated by ddf,
+products of equal degree irreducibles by edf.
+
+Usage:
+    python3 benchmarks/bench_factor.py [max_degree]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.polynom_perf import Polynom
+from tasks.gcm_pwn import factor, sff, ddf, edf
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _stages(f):
+    """sff, ddf and edf without shared Frobenius images."""
+    factors = []
+    for item in sff(f):
+        for distinct in ddf(Polynom(item["factor"])):
+            for irreducible in edf(Polynom(distinct["factor"]), distinct["degree"]):
+                factors.append((irreducible.int, item["exponent"]))
+    return sorted(factors)
+
+
+def _random_product(degree):
+    """Factors of degree 1 to 8 (some of them repeated) up to about degree."""
+    f = Polynom([1])
+    while f.degree() < degree:
+        part = Polynom([random.getrandbits(128) for _ in range(random.randint(1, 8))] + [1])
+        f = f * part ** random.choice((1, 1, 2))
+    return f
+
+
+def _equal_degree_product(d, count):
+    """A product of count random irreducible polynomials of degree d, which leaves the work to edf."""
+    f = Polynom([1])
+    found = 0
+    while found < count:
+        part = Polynom([random.getrandbits(128) for _ in range(d)] + [1])
+        if ddf(part)[0]["degree"] == d:
+            f = f * part
+            found += 1
+    return f
+
+
+def _compare(label, f):
+    separate, expected = _timed(_stages, f)
+    pipeline, result = _timed(factor, f)
+    assert sorted((item["factor"], item["exponent"]) for item in result) == expected, "factors differ"
+    print(f"{label:<16} deg {f.degree():>4}   stages {separate * 1000:9.1f} ms   factor {pipeline * 1000:9.1f} ms"
+          f"   speedup {separate / pipeline:5.2f}x")
+
+
+def main():
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    random.seed(1)
+    degree = 16
+    while degree <= max_degree:
+        _compare("random", _random_product(degree))
+        degree *= 2
+    for d in (4, 8, 16):
+        _compare(f"equal degree {d}", _equal_degree_product(d, max(2, max_degree // (2 * d))))
+
+
+if __name__ == "__main__":
+    main()
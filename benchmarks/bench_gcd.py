@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark of Polynom.gcd: plain Euclid against the half-GCD.
+
+For random polynomials of growing degree, times gcd once with the half-GCD
+disabled and once with it enabled from HALF_GCD_BASE_DEGREE on, and checks
+that the results agree. HALF_GCD_THRESHOLD should sit where the half-GCD
+starts to win.
+
+Usage:
+    python3 benchmarks/bench_gcd.py [max_degree]
+"""
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import tasks.polynom_perf as polynom_perf
+from tasks.polynom_perf import Polynom
+
+
+def _timed_gcd(a, b, threshold):
+    polynom_perf.HALF_GCD_THRESHOLD = threshold
+    start = time.perf_counter()
+    result = a.gcd(b)
+    return time.perf_counter() - start, result
+
+
+def main():
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 8192
+    random.seed(1)
+    degree = 512
+    while degree <= max_degree:
+        common = Polynom([random.getrandbits(128) for _ in range(8)] + [1])
+        a = common * Polynom([random.getrandbits(128) for _ in range(degree - 8)] + [1])
+        b = common * Polynom([random.getrandbits(128) for _ in range(degree - 9)] + [1])
+        euclid, expected = _timed_gcd(a, b, float("inf"))
+        half, result = _timed_gcd(a, b, polynom_perf.HALF_GCD_BASE_DEGREE)
+        assert result == expected, "gcds differ"
+        print(f"deg {degree:>5}   euclid {euclid * 1000:9.1f} ms   half-gcd {half * 1000:9.1f} ms"
+              f"   speedup {euclid / half:5.2f}x")
+        degree = degree * 3 // 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the GF(2^128) multiplication kernel.
+
+Compares the windowed Karatsuba kernel in tasks/gf128.c against the
+previous bit-serial Russian peasant loop, which is compiled here as a reference.
+Both kernels are called through cffi with preallocated buffers, so the numbers
+mostly reflect the cost of the multiplication itself.
+
+Usage:
+    python3 benchmarks/bench_gfmul.py [iterations]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cffi import FFI
+from tasks.gf128 import ffi, lib, NATIVE
+from tasks.polynom_perf import R_LO, R_HI
+
+legacy_ffi = FFI()
+legacy_ffi.cdef("""
+    void gf2_128_mul_legacy(
+        const uint64_t a[2],
+        const uint64_t b[2],
+        const uint64_t reduction[2],
+        uint64_t result[2]
+    );
+""")
+
+legacy_lib = legacy_ffi.verify(r"""
+    #include <stdint.h>
+
+    void gf2_128_mul_legacy(
+        const uint64_t a[2],
+        const uint64_t b[2],
+        const uint64_t reduction[2],
+        uint64_t result[2]
+    ) {
+        uint64_t A[2], B[2], P[2];
+        A[0] = a[0]; A[1] = a[1];
+        B[0] = b[0]; B[1] = b[1];
+        P[0] = 0;    P[1] = 0;
+
+        while (B[0] != 0 || B[1] != 0) {
+            if (B[0] & 1) {
+                P[0] ^= A[0];
+                P[1] ^= A[1];
+            }
+            int ovf = (A[1] >> 63) & 1;
+            A[1] = (A[1] << 1) | (A[0] >> 63);
+            A[0] <<= 1;
+            if (ovf) {
+                A[0] ^= reduction[0];
+                A[1] ^= reduction[1];
+            }
+            B[0] = (B[0] >> 1) | (B[1] << 63);
+            B[1] >>= 1;
+        }
+        result[0] = P[0];
+        result[1] = P[1];
+    }
+""", extra_compile_args=["-O3", "-std=c99"])
+
+
+def _operands(module_ffi, count):
+    """Build random operand buffers for the given ffi instance."""
+    operands = []
+    for _ in range(count):
+        a = module_ffi.new("uint64_t[2]", [random.getrandbits(64), random.getrandbits(64)])
+        b = module_ffi.new("uint64_t[2]", [random.getrandbits(64), random.getrandbits(64)])
+        operands.append((a, b))
+    return operands
+
+
+def _run(module_ffi, mul, iterations):
+    """Return multiplications per second for the given kernel."""
+    operands = _operands(module_ffi, 256)
+    reduction = module_ffi.new("uint64_t[2]", [R_LO, R_HI])
+    result = module_ffi.new("uint64_t[2]")
+    rounds = max(1, iterations // len(operands))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for a, b in operands:
+            mul(a, b, reduction, result)
+    elapsed = time.perf_counter() - start
+    return rounds * len(operands) / elapsed
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    if not NATIVE:
+        sys.exit("The compiled field kernel is not available")
+    random.seed(0)
+
+    legacy = _run(legacy_ffi, legacy_lib.gf2_128_mul_legacy, iterations)
+    windowed = _run(ffi, lib.gf2_128_mul, iterations)
+
+    print(f"bit-serial loop:     {legacy:12,.0f} ops/sec")
+    print(f"windowed karatsuba:  {windowed:12,.0f} ops/sec")
+    print(f"speedup:             {windowed / legacy:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark for field inversion on the gfdiv, gfpoly_divmod and gfpoly_gcd paths.
+
+Runs each workload once with the previous pure Python binary extended Euclid
+and once with the native Itoh-Tsujii inversion of the field kernel.
+The gfdiv and gfpoly_divmod workloads come from json/divtest.json,
+json/divtest3.json and json/test.json; gfpoly_gcd adds synthetic inputs.
+
+Usage:
+    python3 benchmarks/bench_inversion.py [repeats]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.gf128 import kernel, _PythonKernel
+from tasks.polynom_perf import Polynom
+from common import poly_to_b64
+from kauma_conditional_mp import handle_gfdiv, handle_gfpoly_divmod, handle_gfpoly_gcd
+
+
+def _load_cases(action, *files):
+    """Collect the arguments of all test cases with the given action."""
+    cases = []
+    for name in files:
+        with open(os.path.join(ROOT, "json", name), "r") as file:
+            data = json.load(file)
+        for test_case in data["testcases"].values():
+            if test_case["action"] == action:
+                cases.append(test_case["arguments"])
+    return cases
+
+
+def _synthetic_gcd_cases(count, degree):
+    """Pairs of random polynomials sharing a random monic common factor."""
+    random.seed(1)
+    cases = []
+    for _ in range(count):
+        common = Polynom([random.getrandbits(128) for _ in range(degree // 2)] + [1])
+        a = Polynom([random.getrandbits(128) for _ in range(degree // 2 + 1)]) * common
+        b = Polynom([random.getrandbits(128) for _ in range(degree // 2)]) * common
+        cases.append({"A": poly_to_b64(a.int), "B": poly_to_b64(b.int)})
+    return cases
+
+
+def _time(handler, cases, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for arguments in cases:
+            try:
+                handler(arguments)
+            except ValueError:
+                # Division by zero cases in the corpus
+                pass
+    return time.perf_counter() - start
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    workloads = [
+        ("gfdiv", handle_gfdiv, _load_cases("gfdiv", "divtest.json", "test.json"), repeats * 50),
+        ("gfpoly_divmod", handle_gfpoly_divmod,
+         _load_cases("gfpoly_divmod", "divtest3.json", "test.json"), repeats),
+        ("gfpoly_gcd", handle_gfpoly_gcd,
+         _load_cases("gfpoly_gcd", "test.json") + _synthetic_gcd_cases(5, 60), repeats),
+    ]
+    legacy_inv = _PythonKernel().inv
+
+    random.seed(2)
+    elements = [random.getrandbits(128) | 1 for _ in range(2000)]
+    euclid = _time(legacy_inv, elements, repeats)
+    itoh_tsujii = _time(kernel.inv, elements, repeats)
+    print(f"{'inversion':<14} euclid {euclid * 1000:9.1f} ms   itoh-tsujii {itoh_tsujii * 1000:9.1f} ms"
+          f"   speedup {euclid / itoh_tsujii:5.2f}x")
+
+    for name, handler, cases, rounds in workloads:
+        kernel.inv = legacy_inv
+        try:
+            euclid = _time(handler, cases, rounds)
+        finally:
+            del kernel.inv
+        itoh_tsujii = _time(handler, cases, rounds)
+        print(f"{name:<14} euclid {euclid * 1000:9.1f} ms   itoh-tsujii {itoh_tsujii * 1000:9.1f} ms"
+              f"   speedup {euclid / itoh_tsujii:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
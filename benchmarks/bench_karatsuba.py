@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark for KARATSUBA_THRESHOLD in tasks/polynom_perf.py.
+
+For doubling sizes n, times a direct n x n schoolbook product in the kernel
+against one Karatsuba split into three n/2 x n/2 products. The threshold
+is the largest size at which the direct product still wins; set it with
+KAUMA_KARATSUBA_THRESHOLD or update the default.
+
+Usage:
+    python3 benchmarks/bench_karatsuba.py [repeats]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tasks.gf128 import kernel, pack
+from tasks.polynom_perf import KARATSUBA_THRESHOLD, _karatsuba
+
+SIZES = (8, 16, 32, 64, 128, 256, 512)
+
+
+def _best_time(func, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    random.seed(1)
+    threshold = None
+    for n in SIZES:
+        a = pack(random.getrandbits(128) for _ in range(n))
+        b = pack(random.getrandbits(128) for _ in range(n))
+        direct = _best_time(lambda: kernel.poly_mul(a, n, b, n), repeats)
+        split = _best_time(lambda: _karatsuba(a, n, b, n, n // 2), repeats)
+        if threshold is None and split < direct:
+            threshold = n // 2
+        print(f"n {n:>4}   schoolbook {direct * 1e6:10.1f} us   one split {split * 1e6:10.1f} us"
+              f"   ratio {direct / split:5.2f}x")
+    print(f"measured threshold {threshold or SIZES[-1]}, current KARATSUBA_THRESHOLD {KARATSUBA_THRESHOLD}")
+
+
+if __name__ == "__main__":
+    main()
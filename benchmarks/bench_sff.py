@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the square-free factorization: the textbook loop against
+Yun's step with square roots, and exact_div against the general division.
+
+Runs json/gfpoly_sff.json with both algorithms and checks that the results
+agree; constant inputs, on which the textbook loop fails, are skipped.
+
+Usage:
+    python3 benchmarks/bench_sff.py [max_degree]
+"""
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.polynom_perf import Polynom
+from tasks.gcm_pwn import sff
+from common import _base64_to_poly
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    max_degree = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    with open(os.path.join(ROOT, "json", "gfpoly_sff.json"), "r") as file:
+        data = json.load(file)
+    corpus = [_base64_to_poly(test_case["arguments"]["F"]) for test_case in data["testcases"].values()
+              if test_case["action"] == "gfpoly_factor_sff"]
+    corpus = [f for f in corpus if f.degree() > 0]
+
+    classic, expected = _timed(lambda: [sff(f, algorithm="classic") for f in corpus])
+    yun, results = _timed(lambda: [sff(f, algorithm="yun") for f in corpus])
+    assert results == expected, "factorizations differ"
+    print(f"gfpoly_sff.json ({len(corpus)} cases)   classic {classic * 1000:9.1f} ms   yun {yun * 1000:9.1f} ms"
+          f"   speedup {classic / yun:5.2f}x")
+
+    random.seed(1)
+    degree = 32
+    while degree <= max_degree:
+        # A large dividend by a small divisor and the other way around
+        for quotient_degree, divisor_degree in ((degree, 4), (4, degree)):
+            q = Polynom([random.getrandbits(128) for _ in range(quotient_degree)] + [1])
+            b = Polynom([random.getrandbits(128) for _ in range(divisor_degree)] + [1])
+            a = q * b
+            general, (quotient, _) = _timed(lambda: a / b)
+            exact, result = _timed(lambda: a.exact_div(b))
+            assert result == quotient
+            print(f"deg(q) {quotient_degree:>4} deg(b) {divisor_degree:>4}   / {general * 1000:8.2f} ms"
+                  f"   exact_div {exact * 1000:8.2f} ms   speedup {general / exact:6.2f}x")
+        degree *= 4
+
+
+if __name__ == "__main__":
+    main()
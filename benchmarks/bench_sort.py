@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark of gfpoly_sort on json/polysort.json scaled up.
+
+Compares decoding into Polynom objects with a tuple key per polynomial
+(the previous handle_gfpoly_sort) against the precomputed byte keys.
+
+Usage:
+    python3 benchmarks/bench_sort.py [max_polys]
+"""
+import base64
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from tasks.poly_sort import sort_b64_polys
+from common import _base64_to_poly, poly_to_b64
+
+
+def _tuple_sort(polys):
+    decoded = [_base64_to_poly(poly) for poly in polys]
+    ordered = sorted(decoded, key=lambda poly: tuple([poly.degree()] + poly.int[::-1]))
+    return [poly_to_b64(poly.int) for poly in ordered]
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _scaled(corpus, n):
+    """n polynomials: the corpus repeated, plus random ones of similar degrees."""
+    random.seed(1)
+    polys = []
+    while len(polys) < n:
+        poly = random.choice(corpus)
+        polys.append(poly)
+        polys.append([base64.b64encode(random.getrandbits(128).to_bytes(16, 'little')).decode()
+                      for _ in range(len(poly) + random.randint(-1, 1) or 1)])
+    return polys[:n]
+
+
+def main():
+    max_polys = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with open(os.path.join(ROOT, "json", "polysort.json"), "r") as file:
+        data = json.load(file)
+    corpus = [poly for test_case in data["testcases"].values() for poly in test_case["arguments"]["polys"]]
+
+    n = 1000
+    while n <= max_polys:
+        polys = _scaled(corpus, n)
+        baseline, expected = _timed(_tuple_sort, polys)
+        keyed, result = _timed(sort_b64_polys, polys)
+        assert result == expected, "byte key sort differs"
+        print(f"{n:>8} polys   tuple keys {baseline * 1000:9.1f} ms   byte keys {keyed * 1000:9.1f} ms"
+              f"   speedup {baseline / keyed:5.2f}x")
+        n *= 10
+
+
+if __name__ == "__main__":
+    main()
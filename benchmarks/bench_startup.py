@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the GF(2^128) kernel.
+
+Measures cold `import tasks.polynom_perf` latency in fresh interpreters, as a
+spawned pool worker in kauma_conditional_mp.py would see it, and compares it
+with the previous approach of calling ffi.verify on the kernel source at import:
+once with a warm verify cache and once with an empty one.
+
+Usage:
+    python3 benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import tasks.polynom_perf
+print(time.perf_counter() - start)
+"""
+
+VERIFY_SNIPPET = """
+import sys, time
+start = time.perf_counter()
+from cffi import FFI
+from tasks import gf128_build
+ffi = FFI()
+ffi.cdef(gf128_build.CDEF)
+lib = ffi.verify(gf128_build.read_source(), tmpdir=sys.argv[1],
+                 extra_compile_args=gf128_build.EXTRA_COMPILE_ARGS)
+print(time.perf_counter() - start)
+"""
+
+
+def _time_snippet(snippet, *args) -> float:
+    """Run a snippet in a fresh interpreter and return the time it reports."""
+    output = subprocess.run(
+        [sys.executable, "-c", snippet, *args],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _report(label, samples):
+    print(f"{label:<32} median {statistics.median(samples) * 1000:8.1f} ms"
+          f"   min {min(samples) * 1000:8.1f} ms")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    cold = []
+    for _ in range(max(1, runs // 2)):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cold.append(_time_snippet(VERIFY_SNIPPET, tmpdir))
+    _report("ffi.verify, empty cache", cold)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _time_snippet(VERIFY_SNIPPET, tmpdir)
+        _report("ffi.verify, warm cache", [_time_snippet(VERIFY_SNIPPET, tmpdir) for _ in range(runs)])
+
+    _report("import tasks.polynom_perf", [_time_snippet(IMPORT_SNIPPET) for _ in range(runs)])
+
+
+if __name__ == "__main__":
+    main()
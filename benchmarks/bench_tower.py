@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the tower field backend against the polynomial basis kernel.
+
+Runs raw multiplication and inversion and the gfdiv, gfpoly_divmod and
+gfpoly_gcd workloads of bench_inversion.py once per backend, by swapping the
+kernel used by tasks/polynom_perf.py. KAUMA_GF_BACKEND=tower selects the
+tower backend for a whole run instead.
+
+Usage:
+    python3 benchmarks/bench_tower.py [repeats]
+"""
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import tasks.polynom_perf as polynom_perf
+from tasks.gf128_tower import TowerKernel
+from kauma_conditional_mp import handle_gfdiv, handle_gfpoly_divmod, handle_gfpoly_gcd
+from bench_inversion import _load_cases, _synthetic_gcd_cases, _time
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    base = polynom_perf.kernel
+    tower = TowerKernel(base)
+
+    random.seed(2)
+    elements = [random.getrandbits(128) | 1 for _ in range(2000)]
+    pairs = list(zip(elements, reversed(elements)))
+    raw = [
+        ("mul", lambda k: (lambda pair: k.mul(*pair)), pairs),
+        ("inversion", lambda k: k.inv, elements),
+    ]
+    for name, make, cases in raw:
+        poly = _time(make(base), cases, repeats)
+        towered = _time(make(tower), cases, repeats)
+        print(f"{name:<14} poly {poly * 1000:9.1f} ms   tower {towered * 1000:9.1f} ms"
+              f"   ratio {poly / towered:5.2f}x")
+
+    workloads = [
+        ("gfdiv", handle_gfdiv, _load_cases("gfdiv", "divtest.json", "test.json"), repeats * 50),
+        ("gfpoly_divmod", handle_gfpoly_divmod,
+         _load_cases("gfpoly_divmod", "divtest3.json", "test.json"), repeats),
+        ("gfpoly_gcd", handle_gfpoly_gcd,
+         _load_cases("gfpoly_gcd", "test.json") + _synthetic_gcd_cases(5, 60), repeats),
+    ]
+    for name, handler, cases, rounds in workloads:
+        poly = _time(handler, cases, rounds)
+        polynom_perf.kernel = tower
+        try:
+            towered = _time(handler, cases, rounds)
+        finally:
+            polynom_perf.kernel = base
+        print(f"{name:<14} poly {poly * 1000:9.1f} ms   tower {towered * 1000:9.1f} ms"
+              f"   ratio {poly / towered:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
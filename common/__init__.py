@@ -1,5 +1,6 @@
 import base64 
-from tasks.polynom_perf import FieldElement, Polynom
+from tasks.polynom_perf import Polynom, BIT_REVERSE_BYTES
+from tasks.polynom_perf import gcm_sem as _gcm_sem
 def slice_input(input) -> list:
     """
     Slice input data into 16-byte blocks for cipher operation.
@@ -29,15 +30,11 @@ def _base64_to_poly(poly):
         Returns:
             Polynom instantiated on a list of integers representing coefficients in GCM semantic
         """
-        integer_list = []
-        field_element = FieldElement(0)  # Create a FieldElement instance to use gcm_sem
-    
-        for b46str in poly:
-            bytes_val = base64.b64decode(b46str)
-            int_val = int.from_bytes(bytes_val, 'little')
-                # Convert to GCM semantic using the FieldElement's gcm_sem method
-            gcm_val = field_element.gcm_sem(int_val)
-            integer_list.append(gcm_val)
+        integer_list = [
+            # Reversing the bits of each byte converts to GCM semantic
+            int.from_bytes(base64.b64decode(b64str).translate(BIT_REVERSE_BYTES), 'little')
+            for b64str in poly
+        ]
         return Polynom(integer_list)
 
 def reverse_bits_with_table(byte_val):
@@ -64,17 +61,11 @@ def poly_to_b64(poly):
     integer_list = []
     
     for value in poly:
-        # Convert the integer value to a byte array (16 bytes for 128 bits)
-        byte_array = value.to_bytes(16, 'little')  # 16 bytes = 128 bits
-        
-        # Reverse the bits within each byte using the BIT_REVERSE_TABLE
-        reversed_byte_array = bytearray(reverse_bits_with_table(byte) for byte in byte_array)
+        # Convert the integer value to 16 bytes and reverse the bits within each byte
+        reversed_byte_array = value.to_bytes(16, 'little').translate(BIT_REVERSE_BYTES)
         
         # Encode the reversed byte array into base64
-        base64_encoded = base64.b64encode(reversed_byte_array).decode()
-        
-        # Append the base64-encoded string to the result list
-        integer_list.append(base64_encoded)
+        integer_list.append(base64.b64encode(reversed_byte_array).decode())
     return integer_list
 def transform_sort(input, key):
      return [{"factor": poly_to_b64(item["factor"]), key: item[key]} for item in input 
@@ -94,9 +85,7 @@ def gcm_sem(element) -> int:
             transformed element
         """
         
-        element = element.to_bytes(16, 'little') 
-        reversed_element = bytes(BIT_REVERSE_TABLE[b] for b in element)
-        return int.from_bytes(reversed_element, 'little')
+        return _gcm_sem(element)
 
 def pad_ad(ad):
     """
@@ -4,16 +4,20 @@ import json
 from tasks.poly import block2poly, poly2block, block2poly_gcm, poly2block_gcm
 from common.common import stderr_write
 import multiprocessing as mp
-from tasks.gfmul import gfmul
+from tasks.gfmul import gfmul, gfmul_gcm
 from tasks.sea import sea_enc, sea_dec
 from tasks.xex import XEX
 from tasks.gcm import GCM_encrypt,  GCM_decrypt
 from tasks.padding_oracle_crack import padding_oracle_crack
 from tasks.polynom_perf import FieldElement, Polynom
-from tasks.gcm_pwn import constr_ghash_poly, sff, ddf, edf, constr_ghash_poly, gcm_crack
+import tasks.polynom_perf as polynom_perf
+from tasks.field_array import FieldElementArray, ARRAY_MIN_LEN
+from tasks.poly_sort import sort_b64_polys
+from tasks.gf128 import kernel
+from tasks.gcm_pwn import constr_ghash_poly, sff, ddf, edf, constr_ghash_poly, gcm_crack, roots, factor
 import time, base64
 from argparse import ArgumentParser
-from common import _base64_to_poly, poly_to_b64, transform_sort, gcm_sem
+from common import _base64_to_poly, poly_to_b64, transform_sort
 
 
 
@@ -22,6 +26,10 @@ def process_test_case(test_case, test_case_id):
     arguments = test_case.get("arguments")
     
     result = {}
+    # Set with KAUMA_POLY_MEMO=<entries>, reported per test case
+    memo = polynom_perf.POLY_MEMO
+    if memo is not None:
+        hits, misses = memo.hits, memo.misses
     try:        
         match action:
             case "poly2block":
@@ -68,10 +76,16 @@ def process_test_case(test_case, test_case_id):
                 result = handle_gfpoly_factor_ddf(arguments)
             case "gfpoly_factor_edf":
                 result = handle_gfpoly_factor_edf(arguments)
+            case "gfpoly_roots":
+                result = handle_gfpoly_roots(arguments)
+            case "gfpoly_factor":
+                result = handle_gfpoly_factor(arguments)
             case "gcm_crack":
                 result = handle_gcm_crack(arguments)
             case _:
                 stderr_write(f"Unknown error for {action} with ID:{test_case_id}")
+        if memo is not None:
+            stderr_write(f"Memo for {test_case_id}: {memo.hits - hits} hits, {memo.misses - misses} misses")
         return test_case_id, result
     
     except Exception as e:
@@ -101,12 +115,10 @@ def handle_gfmul(arguments):
         res = gfmul(a,b)
         return {"product":res}
     if arguments["semantic"] == 'gcm':
-        a = int.from_bytes(base64.b64decode(arguments["a"]), 'little')
-        b = int.from_bytes(base64.b64decode(arguments["b"]), 'little')
-        a_gcm, b_gcm = FieldElement(gcm_sem(a)), FieldElement(gcm_sem(b))
-        res = (a_gcm*b_gcm).element
-        res_gcm = gcm_sem(res)
-        return {"product":base64.b64encode(int.to_bytes(res_gcm,16, 'little')).decode('utf-8')}
+        a = arguments["a"]
+        b = arguments["b"]
+        res = gfmul_gcm(a, b)
+        return {"product":res}
 def handle_sea(arguments):
     if arguments["mode"] =='encrypt':
         key = arguments["key"]
@@ -170,6 +182,17 @@ def handle_po(arguments):
     return {"plaintext": result}
 
 def handle_gfpoly_add(arguments):
+    if max(len(arguments["A"]), len(arguments["B"])) >= ARRAY_MIN_LEN:
+        a = FieldElementArray.from_b64(arguments["A"])
+        b = FieldElementArray.from_b64(arguments["B"])
+        if a == b:
+            return {"S": poly_to_b64([0])}
+        # Like Polynom.__add__, adding [0] returns the other operand as it is
+        if len(a) == 1 and a[0] == 0:
+            return {"S": b.to_b64()}
+        if len(b) == 1 and b[0] == 0:
+            return {"S": a.to_b64()}
+        return {"S": (a + b).trim().to_b64()}
     a = _base64_to_poly(arguments["A"])
     b = _base64_to_poly(arguments["B"])
     res = poly_to_b64((a + b).int)
@@ -213,19 +236,25 @@ def handle_gfpoly_powmod(arguments):
     return {"Z":result}
 
 def handle_gfpoly_sort(arguments):
-    polys = arguments["polys"]
-    polys_obj = [_base64_to_poly(group) for group in polys]
-    sorted_polynomials = polys_obj[0].gfpoly_sort(*polys_obj[1:])
-    sorted_polynomials_representation = [poly_to_b64(p.int) for p in sorted_polynomials]
-    return {"sorted_polys": sorted_polynomials_representation}
+    # Sorted by precomputed byte keys, without decoding into Polynom objects
+    return {"sorted_polys": sort_b64_polys(arguments["polys"])}
 
 def handle_gfpoly_makemonic(arguments):
+    if len(arguments["A"]) >= ARRAY_MIN_LEN:
+        coeffs = FieldElementArray.from_b64(arguments["A"])
+        # inv(0) is 0, so check like the Polynom path instead of returning zeros
+        if coeffs[-1] == 0:
+            raise ValueError("Division by zero")
+        return {"A*": (coeffs * kernel.inv(coeffs[-1])).to_b64()}
     poly = _base64_to_poly(arguments["A"])
     monic_poly = poly.gfpoly_makemonic()
     res = poly_to_b64(monic_poly)
     return {"A*": res}
 
 def handle_gfpoly_sqrt(arguments):
+    if len(arguments["Q"]) >= ARRAY_MIN_LEN:
+        coeffs = FieldElementArray.from_b64(arguments["Q"])
+        return {"S": coeffs[::2].sqrt().to_b64()}
     poly = _base64_to_poly(arguments["Q"])
     poly_sqrt = poly.sqrt()
     res = poly_to_b64(poly_sqrt.int)
@@ -268,6 +297,17 @@ def handle_gfpoly_factor_edf(arguments):
     return {"factors": z_sorted}
 
 
+def handle_gfpoly_roots(arguments):
+    f = _base64_to_poly(arguments["F"])
+    return {"roots": poly_to_b64(roots(f))}
+
+
+def handle_gfpoly_factor(arguments):
+    f = _base64_to_poly(arguments["F"])
+    result = factor(f)
+    return {"factors": transform_sort(result, "exponent")}
+
+
 def handle_gcm_crack(arguments):
     x = FieldElement(0)
     m1 = arguments.get('m1', {})
@@ -354,12 +394,19 @@ class ParseJson:
         sequential_cases = []
 
         for test_case_id, test_case in data["testcases"].items():
-            if test_case.get("action") in {"handle_gfpoly_gcd", "padding_oracle", "gfpoly_pow", "gfpoly_factor_sff", "gfpoly_factor_ddf", "gfpoly_factor_edf"}:
+            if test_case.get("action") in {"handle_gfpoly_gcd", "padding_oracle", "gfpoly_pow", "gfpoly_factor_sff", "gfpoly_factor_ddf", "gfpoly_factor_edf", "gfpoly_roots", "gfpoly_factor"}:
 
                 parallel_cases.append((test_case, test_case_id))
             else:
                 sequential_cases.append((test_case, test_case_id))
         
+        # A single heavy case runs in this process, where its factorization
+        # can use the worker pool of tasks/parallel.py (pool workers are
+        # daemonic and may not start processes of their own)
+        if len(parallel_cases) == 1:
+            sequential_cases.extend(parallel_cases)
+            parallel_cases = []
+
         # Process parallel cases using multiprocessing
         if parallel_cases:
             num_cores = mp.cpu_count()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Vectors of GF(2^128) elements.
+
+FieldElementArray stores n field elements in an (n, 2) uint64 NumPy array,
+low word first, which is exactly the packed layout of the field kernel. XOR,
+slicing and the GCM bit reversal run as NumPy array operations; products,
+squares and roots are a single call into the kernel on the same memory.
+Without NumPy the elements live in a packed bytearray with the same interface.
+"""
+import base64
+
+from tasks.gf128 import kernel, pack, unpack
+from tasks.polynom_perf import BIT_REVERSE_TABLE, BIT_REVERSE_BYTES
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAVE_NUMPY = np is not None
+# Below this many coefficients the list-backed Polynom is just as fast
+ARRAY_MIN_LEN = 64
+
+if HAVE_NUMPY:
+    _BIT_REVERSE_NP = np.array(BIT_REVERSE_TABLE, dtype=np.uint8)
+
+
+class FieldElementArray:
+    """
+    A fixed-length vector of field elements.
+
+    Elements use the field element representation (bit i is the coefficient
+    of x^i). Use from_b64/to_b64 to convert from and to GCM semantic blocks.
+    """
+
+    def __init__(self, data):
+        """
+        Wrap existing storage.
+
+        :param data: An (n, 2) uint64 array with NumPy, a packed bytearray otherwise.
+        """
+        self._data = data
+
+    @classmethod
+    def from_ints(cls, values) -> 'FieldElementArray':
+        """Create an array from 128-bit integers."""
+        return cls._from_packed(pack(values))
+
+    @classmethod
+    def from_b64(cls, blocks, gcm: bool = True) -> 'FieldElementArray':
+        """
+        Create an array from base64 encoded 16 byte blocks.
+
+        :param blocks: A list of base64 strings.
+        :param gcm: Whether the blocks are in GCM semantic (bits reversed per byte).
+        """
+        raw = b''.join(base64.b64decode(block).ljust(16, b'\x00') for block in blocks)
+        if gcm and not HAVE_NUMPY:
+            raw = raw.translate(BIT_REVERSE_BYTES)
+        array = cls._from_packed(bytearray(raw))
+        if gcm and HAVE_NUMPY:
+            array = array._reverse_bits()
+        return array
+
+    @classmethod
+    def zeros(cls, n: int) -> 'FieldElementArray':
+        """Create an array of n zero elements."""
+        return cls._from_packed(bytearray(16 * n))
+
+    @classmethod
+    def _from_packed(cls, buf) -> 'FieldElementArray':
+        if HAVE_NUMPY:
+            return cls(np.frombuffer(buf, dtype='<u8').reshape(-1, 2).copy())
+        return cls(bytearray(buf))
+
+    def _packed(self):
+        """The elements as a contiguous buffer in the kernel layout."""
+        if HAVE_NUMPY:
+            return np.ascontiguousarray(self._data).view(np.uint8).reshape(-1)
+        return self._data
+
+    def _reverse_bits(self) -> 'FieldElementArray':
+        """Reverse the bits within every byte (GCM semantic conversion)."""
+        if HAVE_NUMPY:
+            return FieldElementArray(_BIT_REVERSE_NP[self._packed()].view('<u8').reshape(-1, 2))
+        return FieldElementArray(bytearray(bytes(self._data).translate(BIT_REVERSE_BYTES)))
+
+    def to_ints(self) -> list:
+        """Return the elements as a list of 128-bit integers."""
+        return unpack(bytes(self._packed()))
+
+    def to_b64(self, gcm: bool = True) -> list:
+        """Return the elements as base64 encoded 16 byte blocks."""
+        raw = bytes((self._reverse_bits() if gcm else self)._packed())
+        return [base64.b64encode(raw[i:i + 16]).decode() for i in range(0, len(raw), 16)]
+
+    def __len__(self) -> int:
+        if HAVE_NUMPY:
+            return self._data.shape[0]
+        return len(self._data) // 16
+
+    def __getitem__(self, index):
+        """An int for an integer index, a FieldElementArray for a slice."""
+        if isinstance(index, slice):
+            if HAVE_NUMPY:
+                return FieldElementArray(self._data[index])
+            return FieldElementArray.from_ints(self.to_ints()[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("FieldElementArray index out of range")
+        if HAVE_NUMPY:
+            return int(self._data[index, 0]) | (int(self._data[index, 1]) << 64)
+        return int.from_bytes(self._data[16 * index:16 * index + 16], 'little')
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FieldElementArray):
+            return NotImplemented
+        return len(self) == len(other) and bytes(self._packed()) == bytes(other._packed())
+
+    def padded(self, n: int) -> 'FieldElementArray':
+        """Return a copy extended with zero elements to length n."""
+        missing = n - len(self)
+        if missing <= 0:
+            return self
+        return FieldElementArray._from_packed(bytearray(bytes(self._packed())) + bytearray(16 * missing))
+
+    def trim(self) -> 'FieldElementArray':
+        """Drop trailing zero elements, like Polynom._normalize."""
+        if HAVE_NUMPY:
+            nonzero = np.flatnonzero(self._data[:, 0] | self._data[:, 1])
+            end = int(nonzero[-1]) + 1 if len(nonzero) else 0
+            return FieldElementArray(self._data[:end])
+        raw = bytes(self._data)
+        end = len(raw.rstrip(b'\x00'))
+        return FieldElementArray(bytearray(raw[:(end + 15) // 16 * 16]))
+
+    def __add__(self, other) -> 'FieldElementArray':
+        """
+        Element-wise addition (XOR).
+
+        other may be a FieldElementArray, shorter operands are zero-padded,
+        or a single int that is added to every element.
+        """
+        if isinstance(other, int):
+            if HAVE_NUMPY:
+                word = np.array([other & 0xFFFFFFFFFFFFFFFF, other >> 64], dtype='<u8')
+                return FieldElementArray(self._data ^ word)
+            other = FieldElementArray.from_ints([other] * len(self))
+        n = max(len(self), len(other))
+        a, b = self.padded(n), other.padded(n)
+        if HAVE_NUMPY:
+            return FieldElementArray(a._data ^ b._data)
+        total = int.from_bytes(a._data, 'little') ^ int.from_bytes(b._data, 'little')
+        return FieldElementArray(bytearray(total.to_bytes(16 * n, 'little')))
+
+    __xor__ = __add__
+
+    def __mul__(self, other) -> 'FieldElementArray':
+        """
+        Element-wise product with another array of the same length,
+        or product of every element with a single int.
+        """
+        if isinstance(other, int):
+            return FieldElementArray._from_packed(kernel.scalar_mul(other, self._packed(), len(self)))
+        if len(self) != len(other):
+            raise ValueError("Arrays must have the same length")
+        return FieldElementArray._from_packed(kernel.vec_mul(self._packed(), other._packed(), len(self)))
+
+    def square(self) -> 'FieldElementArray':
+        """Element-wise square."""
+        return FieldElementArray._from_packed(kernel.vec_sqr(self._packed(), len(self)))
+
+    def sqrt(self) -> 'FieldElementArray':
+        """Element-wise square root."""
+        return FieldElementArray._from_packed(kernel.vec_sqrt(self._packed(), len(self)))
+
+    def inv(self) -> 'FieldElementArray':
+        """Element-wise inverse with a single field inversion; zeros stay zero."""
+        return FieldElementArray._from_packed(kernel.batch_inv(self._packed(), len(self)))
+
+    def find(self, value: int) -> int:
+        """Return the index of the first element equal to value, or -1."""
+        if HAVE_NUMPY:
+            hits = np.flatnonzero((self._data[:, 0] == (value & 0xFFFFFFFFFFFFFFFF))
+                                  & (self._data[:, 1] == (value >> 64)))
+            return int(hits[0]) if len(hits) else -1
+        try:
+            return self.to_ints().index(value)
+        except ValueError:
+            return -1
+
+    def __repr__(self):
+        return f"FieldElementArray({[hex(v) for v in self.to_ints()]})"
@@ -4,7 +4,8 @@ import base64
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from tasks.sea import sea_enc
 from common import gcm_sem, slice_input, calc_l, pad_slice_ct, pad_ad
-from tasks.polynom_perf import FieldElement
+from tasks.polynom_perf import FieldElement, BIT_REVERSE_BYTES
+from tasks.gf128 import kernel
 
 
 """
@@ -28,29 +29,33 @@ Key components:
 def ghash(associated_data_blocks, h, l,ct_blocks):
     """
     Calculate GHASH for aes_gcm
+
+    The blocks are processed in the bit-reflected GCM domain (blocks read as
+    big-endian integers) with the reflected multiply kernel, so only the
+    result is converted to the field element representation.
     """
-    h = FieldElement(gcm_sem(h.element))
-    l = FieldElement(gcm_sem(l.element))
-    bytes = bytearray(16)
-    ghash_result = FieldElement(int.from_bytes(bytes, 'little'))
+    h = _to_reflected(h.element)
+    ghash_result = 0
     
     for block in associated_data_blocks:
         if len(block) < 16:  # Pad last block if necessary
             block = block + b'\x00' * (16 - len(block))
-        
-        block_fe = gcm_sem(int.from_bytes(block, 'little') )
-        block_rev = FieldElement(block_fe)
-        ghash_result = (ghash_result + block_rev) * h
-    #print(f"Ghash res ad: {gcm_sem(ghash_result.element)}")
+        ghash_result = kernel.mul_gcm(ghash_result ^ int.from_bytes(block, 'big'), h)
     
     for ct_block in ct_blocks:
-        ct_fe = gcm_sem(int.from_bytes(ct_block, 'little'))
-        ct_rev =  FieldElement(ct_fe)
-        ghash_result = (ghash_result +ct_rev) * h 
-    #print(f"ghash res CT: {gcm_sem(ghash_result.element)}") 
-    ghash_result = (ghash_result + l) * h
-    #print(f"Ghash res after add l: {gcm_sem(ghash_result.element)} ")
-    return ghash_result
+        if len(ct_block) < 16:
+            ct_block = ct_block + b'\x00' * (16 - len(ct_block))
+        ghash_result = kernel.mul_gcm(ghash_result ^ int.from_bytes(ct_block, 'big'), h)
+    ghash_result = kernel.mul_gcm(ghash_result ^ _to_reflected(l.element), h)
+    
+    # Back to the field element representation used by the callers
+    block = ghash_result.to_bytes(16, 'big')
+    return FieldElement(int.from_bytes(block.translate(BIT_REVERSE_BYTES), 'little'))
+
+
+def _to_reflected(element):
+    """Read a little-endian block integer as big-endian, the reflected GCM domain."""
+    return int.from_bytes(element.to_bytes(16, 'little'), 'big')
 
 
 def GCM_encrypt(nonce, key, plaintext, associated_data, mode):
@@ -1,12 +1,20 @@
 import base64
+import math
+import os
 import random
 
-from tasks.polynom_perf import Polynom, FieldElement
+from tasks.polynom_perf import Polynom, FieldElement, ModulusContext, gcm_sem
+from tasks.field_array import FieldElementArray
+from tasks import parallel
 from common import calc_l, poly_to_b64, pad_ad, pad_slice_ct
 from tasks.gcm import ghash
 
 
-def sff(polynom):
+# SFF algorithm: "yun" (Yun's step with square roots) or "classic"
+SFF_ALGORITHM = os.environ.get("KAUMA_SFF_ALGORITHM", "yun")
+
+
+def sff(polynom, algorithm=None):
     """
     Compute the Square-Free Factorization of a polynomial.
 
@@ -15,6 +23,7 @@ def sff(polynom):
 
     Args:
         polynom: The input polynomial to be factorized.
+        algorithm: "yun" or "classic"; defaults to SFF_ALGORITHM.
 
     Returns:
         A list of dictionaries containing the square-free factors and their exponents.
@@ -22,19 +31,80 @@ def sff(polynom):
         - 'factor': The coefficients of the square-free factor
         - 'exponent': The exponent of the factor
     """
+    if algorithm is None:
+        algorithm = SFF_ALGORITHM
+    if algorithm == "classic":
+        return sff_classic(polynom)
+    if algorithm != "yun":
+        raise ValueError(f"Unknown SFF algorithm: {algorithm}")
+    factors = [{"factor": factor.int, "exponent": e} for factor, e in _sff_yun(polynom)]
+    if not factors:
+        return []
+    return sort_polynomials_with_key(factors, "exponent")
+
+
+def _sff_yun(f):
+    """
+    Yun's square-free decomposition for characteristic 2.
+
+    For f = prod a_i^i the derivative keeps only the a_i with odd i, so one
+    step of Yun's loop gives c = gcd(f, f') = s^2 with s = prod a_i^(i // 2)
+    and u = f / c = prod of the a_i with odd i. The square root s is
+    decomposed recursively, and each of its factors b with exponent k is
+    split by gcd with u into a_(2k+1) = gcd(u, b) and a_(2k) = b / a_(2k+1).
+    What is left of u is a_1. All divisions are exact.
+
+    Args:
+        f: The polynomial.
+
+    Returns:
+        A list of (factor, exponent) pairs with non-constant factors.
+    """
+    if f.degree() < 1:
+        return []
+    derivative = f.derivative()
+    if derivative.degree() < 0:
+        derivative = Polynom([0])
+    c = f.gcd(derivative)
+    u = f.exact_div(c)
+    factors = []
+    for b, k in _sff_yun(c.sqrt()):
+        g = u.gcd(b)
+        if g.degree() > 0:
+            factors.append((g, 2 * k + 1))
+            u = u.exact_div(g)
+            b = b.exact_div(g)
+        if b.degree() > 0:
+            factors.append((b, 2 * k))
+    if u.degree() > 0:
+        factors.append((u, 1))
+    return factors
+
+
+def sff_classic(polynom):
+    """
+    Square-Free Factorization by the textbook loop of repeated gcds and
+    divisions, recursing on the square root of what is left.
+
+    Args:
+        polynom: The input polynomial to be factorized.
+
+    Returns:
+        The same list of factors and exponents as sff.
+    """
     f_ = polynom.derivative()
-    if f_.int == []:
+    if f_._len() == 0:
         f_ = Polynom([0])
     c = polynom.gcd(f_)
     f, _ = polynom / c
     factors = []
     e = 1
-    while f.int != [1]:
+    while not f._is_one():
         y = f.gcd(c)
         if y != f:
             x, _ = f/y
             # Only add factor if it's not a trivial single-term polynomial
-            if x.int != [1]:
+            if not x._is_one():
                 factors.append({
                     "factor": x.int,
                     "exponent": e
@@ -42,8 +112,8 @@ def sff(polynom):
         f = y
         c, _ = c/y
         e += 1
-    if c.int != [1]:
-        r = sff(c.sqrt())
+    if not c._is_one():
+        r = sff_classic(c.sqrt())
         for x in r:
             factors.append({
                 "factor": x["factor"],
@@ -52,7 +122,17 @@ def sff(polynom):
     return sort_polynomials_with_key(factors, "exponent")
 
 
-def ddf(polynom):
+# DDF algorithm: "classic", "bsgs" (Kaltofen-Shoup) or "auto", which uses
+# bsgs from DDF_BSGS_MIN_DEGREE on. Both return the same factorization
+# (checked by benchmarks/bench_ddf.py). Measured there, bsgs runs at
+# 0.8-0.9x the speed of classic below degree 4, 1.1-1.25x at degree 4,
+# 1.6-3x up to degree 16, 1.8-2.1x on json/gfpoly_ddf.json and 11x at
+# degree 128, hence the default.
+DDF_ALGORITHM = os.environ.get("KAUMA_DDF_ALGORITHM", "auto")
+DDF_BSGS_MIN_DEGREE = 4
+
+
+def ddf(polynom, context=None, algorithm=None, frobenius=None):
     """
     Compute the Distinct Degree Factorization of a polynomial.
 
@@ -60,6 +140,12 @@ def ddf(polynom):
 
     Args:
         polynom: The input polynomial to be factorized.
+        context: Optional ModulusContext for polynom; rebuilt whenever a
+            factor is split off.
+        algorithm: "classic", "bsgs" or "auto"; defaults to DDF_ALGORITHM.
+        frobenius: Optional list that receives X^(q^(2^i)) for i = 0, 1, ...
+            as far as they are computed, each modulo a multiple of every
+            factor of degree above 2^i, for edf.
 
     Returns:
         A list of dictionaries containing the factors and their degrees.
@@ -67,24 +153,42 @@ def ddf(polynom):
         - 'factor': The coefficients of the factor
         - 'degree': The degree of the factor
     """
-    q = 1<<128
+    if algorithm is None:
+        algorithm = DDF_ALGORITHM
+    if algorithm == "auto":
+        algorithm = "bsgs" if polynom.degree() >= DDF_BSGS_MIN_DEGREE else "classic"
+    if algorithm == "bsgs":
+        return ddf_bsgs(polynom, context, frobenius)
+    if algorithm != "classic":
+        raise ValueError(f"Unknown DDF algorithm: {algorithm}")
+
     z = []
     d = 1
     f_ = polynom
+    if context is None:
+        context = ModulusContext(f_)
+    X = Polynom([0, 1])
+    # h_ = X^(q^d) mod f_ is carried over from degree d-1 by one Frobenius
+    # step, i.e. 128 modular squarings for q = 2^128
+    h_ = context.reduce(X.int)
     while f_.degree() >= 2*d:
-        X = Polynom([0, 1])
-
-        h_ = X.poly_powmod(f_, (q**d))
+        for _ in range(128):
+            h_ = context.sqrmod(h_)
+        if frobenius is not None and d & (d - 1) == 0:
+            frobenius.append(h_)
         h = h_+X
         g = h.gcd(f_)
-        if g.int != [1]:
+        if not g._is_one():
             z.append({
                 "factor": g.int,
                 "degree": d
             })
             f_, _ = f_/g
+            context = ModulusContext(f_)
+            # f_ divides the previous modulus, so reducing h_ keeps it valid
+            h_ = context.reduce(h_.packed)
         d += 1
-    if f_.int != [1]:
+    if not f_._is_one():
         z.append({
             "factor": f_.int,
             "degree": f_.degree()
@@ -98,6 +202,90 @@ def ddf(polynom):
     return sort_polynomials_with_key(z, "degree")
 
 
+def ddf_bsgs(polynom, context=None, frobenius=None):
+    """
+    Distinct Degree Factorization with the Kaltofen-Shoup baby-step/giant-step strategy.
+
+    With l about sqrt(n/2), the baby steps X^(q^i) for i < l and the giant
+    steps X^(q^(l*j)) are all computed by Brent-Kung modular composition
+    from X^q. One gcd per giant step with prod_i (X^(q^(l*j)) - X^(q^i))
+    collects all factors with degree in (l*(j-1), l*j], which are then split
+    by degree with gcds modulo that interval factor only.
+
+    Args:
+        polynom: The input polynomial to be factorized.
+        context: Optional ModulusContext for polynom.
+        frobenius: Optional list that receives the baby steps X^(q^(2^i)) mod polynom.
+
+    Returns:
+        The same list of factors and degrees as ddf.
+    """
+    n = polynom.degree()
+    if context is None:
+        context = ModulusContext(polynom)
+    X = Polynom([0, 1])
+    l = max(1, math.ceil(math.sqrt(n / 2)))
+    m = max(1, math.ceil(n / (2 * l)))
+
+    # Baby steps: h_i = X^(q^i) mod f, h_(i+1) = h_i(X^q)
+    x_q = context.reduce(X.int)
+    for _ in range(128):
+        x_q = context.sqrmod(x_q)
+    frobenius_powers = context.composition_powers(x_q)
+    baby = [context.reduce(X.int), x_q]
+    while len(baby) <= l:
+        baby.append(context.compose(baby[-1], frobenius_powers))
+    if frobenius is not None:
+        frobenius.extend(baby[1 << i] for i in range(l.bit_length()))
+
+    # Giant steps: H_j = X^(q^(l*j)) mod f, H_(j+1) = H_j(H_1)
+    giant_powers = context.composition_powers(baby[l])
+    giant = [baby[l]]
+    while len(giant) < m:
+        giant.append(context.compose(giant[-1], giant_powers))
+
+    z = []
+    f_ = polynom
+    for j, H in enumerate(giant, 1):
+        # Every factor left has degree > l*(j-1), so f_ is irreducible if
+        # it can not hold two of them
+        if f_.degree() < 2 * (l * (j - 1) + 1):
+            break
+        differences = [H + baby[i] for i in range(l)]
+        interval = Polynom([1])
+        for difference in differences:
+            interval = context.mulmod(interval, difference)
+        g = f_.gcd(interval)
+        if g._is_one():
+            continue
+        f_, _ = f_ / g
+        # Split the interval factor by degree l*j - i, smallest degree first
+        for i in reversed(range(l)):
+            if g.degree() < 1:
+                break
+            _, difference = differences[i] / g
+            factor = g.gcd(difference)
+            if not factor._is_one():
+                z.append({
+                    "factor": factor.int,
+                    "degree": l * j - i
+                })
+                g, _ = g / factor
+
+    if not f_._is_one():
+        z.append({
+            "factor": f_.int,
+            "degree": f_.degree()
+        })
+    elif z == []:
+        z.append({
+            "factor": polynom.int,
+            "degree": 1
+        })
+
+    return sort_polynomials_with_key(z, "degree")
+
+
 def sort_polynomials_with_key(data, key):
     """
     Sort polynomials based on a specified key.
@@ -134,44 +322,234 @@ def rand_poly(degree):
     return Polynom(random_poly)
 
 
-def edf(polynom, d):
+# EDF inputs and factor() batches of square-free factors of at least this
+# (total) degree use the worker pool
+PARALLEL_MIN_DEGREE = 64
+
+# EDF splitting polynomial: "trace" (absolute trace map) or "power"
+# (h^((q^d - 1) / 3) - 1)
+EDF_SPLITTER = os.environ.get("KAUMA_EDF_SPLITTER", "trace")
+
+
+def edf(polynom, d, context=None, splitter=None, frobenius=None):
     """
     Perform Equal Degree Factorization on a polynomial.
 
+    The default splitter is the trace map T(h) = sum h^(2^i), i < 128 d, which
+    needs only modular squarings and is 0 or 1 in every factor, so each
+    factor lands in gcd(u, T(h)) with probability 1/2. The "power" splitter
+    h^((q^d - 1) / 3) - 1 needs a powmod with an exponent of 128 d bits.
+
+    Factors are split from a work list: every entry u draws its own random
+    h modulo u and computes the splitting polynomial modulo u only, so the
+    cost per round shrinks with the factors instead of staying at deg(f).
+    From PARALLEL_MIN_DEGREE on, the list is split until there is one
+    entry per worker and the entries are finished in the worker pool.
+
+    Given the Frobenius images X^(q^(2^i)) from ddf, the trace is assembled
+    from them by modular composition (ModulusContext.trace_frobenius), and
+    the images are reduced modulo every new factor of the work list instead
+    of being computed again.
+
     Args:
         polynom: The polynomial to be factorized
         d: The degree to use for factorization
+        context: Optional ModulusContext for polynom, used until it first splits
+        splitter: "trace" or "power"; defaults to EDF_SPLITTER
+        frobenius: Optional X^(q^(2^i)) for i = 0, 1, ... modulo a multiple
+            of polynom, as collected by ddf; missing ones are derived by
+            composition. Used by the trace splitter.
 
     Returns:
         A list of sorted polynomial factors
     """
-    f = polynom
-    q = 1<<128
-    n = polynom.degree()//d
-    z = []
-    z.append(f.int)
-    
-    while len(z) < n:
-        h = rand_poly(f.degree()-1)
-        g_ = ((q**d)-1)//3
-        g = h.poly_powmod(f, g_) + Polynom([1])
-        
-        for u in z.copy():
-            u_ = Polynom(u)
-            
-            if u_.degree() > d:
-                j = u_.gcd(g)
-                
-                if (j.int != [1]) and (j.int != u_.int):
-                    z.append(j.int)
-                    u_div_j, _ = u_/j
-                    z.append(u_div_j.int)
-                    z.remove(u)
-    polys_obj = [Polynom(group) for group in z]
+    if splitter is None:
+        splitter = EDF_SPLITTER
+    if splitter not in ("trace", "power"):
+        raise ValueError(f"Unknown EDF splitter: {splitter}")
+    powers = None
+    if frobenius is not None and splitter == "trace" and polynom.degree() > d:
+        if context is None:
+            context = ModulusContext(polynom)
+        powers = _frobenius_powers(context, frobenius, d)
+    limit = None
+    if polynom.degree() >= PARALLEL_MIN_DEGREE and parallel.available():
+        limit = parallel.WORKERS
+    z, pending = _edf_work([(polynom, context, powers)], d, splitter, limit)
+    for factors in parallel.parallel_map(_edf_subtree, [(u, d, splitter, u_powers) for u, _, u_powers in pending]):
+        z.extend(factors)
+    # Normalize all factors with one shared field inversion
+    polys_obj = Polynom.make_monic_batch(z)
     sorted_polynomials = polys_obj[0].gfpoly_sort(*polys_obj[1:])
     return sorted_polynomials
 
 
+def _edf_subtree(args):
+    """Pool task: all equal degree factors of one work list entry (u, d, splitter, powers)."""
+    u, d, splitter, powers = args
+    return _edf_work([(u, None, powers)], d, splitter)[0]
+
+
+def _frobenius_powers(context, frobenius, d):
+    """X^(q^(2^i)) modulo context.modulus for all 2^i < d, from those given by ddf."""
+    count = (d - 1).bit_length()
+    powers = [context.reduce(power.packed) for power in frobenius[:count]]
+    if count and not powers:
+        x_q = context.reduce([0, 1])
+        for _ in range(128):
+            x_q = context.sqrmod(x_q)
+        powers.append(x_q)
+    # X^(q^(2k)) = X^(q^k) composed with itself
+    while len(powers) < count:
+        powers.append(context.compose(powers[-1], context.composition_powers(powers[-1])))
+    return powers
+
+
+def _edf_work(work, d, splitter, limit=None):
+    """
+    Run the EDF work list.
+
+    Args:
+        work: Entries (factor, its ModulusContext or None until it is needed,
+            X^(q^(2^i)) modulo the factor for the trace or None)
+        d: The degree of the irreducible factors
+        splitter: "trace" or "power"
+        limit: Stop once the list holds this many entries
+
+    Returns:
+        (factors found, entries left in the list)
+    """
+    q = 1<<128
+    z = []
+    while work:
+        if limit is not None and len(work) >= limit:
+            break
+        u, u_context, powers = work.pop()
+        if u.degree() <= d:
+            z.append(u)
+            continue
+        if u_context is None:
+            u_context = ModulusContext(u)
+        h = rand_poly(u.degree()-1)
+        if splitter == "trace" and powers is not None:
+            g = u_context.trace_frobenius(h, d, powers)
+        elif splitter == "trace":
+            g = u_context.trace(h, 128 * d)
+        else:
+            g_ = ((q**d)-1)//3
+            g = h.poly_powmod(u_context, g_) + Polynom([1])
+
+        j = u.gcd(g)
+        if 0 < j.degree() < u.degree():
+            u_div_j, _ = u/j
+            for v in (j, u_div_j):
+                if powers is None or v.degree() <= d:
+                    work.append((v, None, None))
+                else:
+                    # v divides u, so the images reduced modulo v stay valid
+                    v_context = ModulusContext(v)
+                    work.append((v, v_context, [v_context.reduce(power.packed) for power in powers]))
+        else:
+            work.append((u, u_context, powers))
+    return z, work
+
+
+def roots(polynom):
+    """
+    Find all roots of a polynomial in GF(2^128).
+
+    g = gcd(f, X^q - X), with X^q mod f from 128 modular squarings, is the
+    product of X - a over the distinct roots a. g is then split with the
+    absolute trace: Tr(beta X) mod g = sum (beta X)^(2^i) for i < 128 is 0
+    or 1 at every root, so gcd(g, Tr(beta X)) holds the roots a with
+    Tr(beta a) = 0. Taking beta = x^0, x^1, ... in turn separates any two
+    distinct roots, so no random polynomials are needed.
+
+    Args:
+        polynom: The polynomial, not zero.
+
+    Returns:
+        The distinct roots as a sorted list of field elements.
+    """
+    f = polynom._normalize()
+    if f.degree() < 0:
+        raise ValueError("The zero polynomial vanishes everywhere")
+    if f.degree() == 0:
+        return []
+    f = Polynom(f.gfpoly_makemonic())
+    context = ModulusContext(f)
+    X = Polynom([0, 1])
+    x_q = context.reduce(X.int)
+    for _ in range(128):
+        x_q = context.sqrmod(x_q)
+    found = []
+    work = [(f.gcd(x_q + X), 0)]
+    while work:
+        g, i = work.pop()
+        if g.degree() == 1:
+            found.append(g[0])
+            continue
+        if g.degree() < 1:
+            continue
+        if i == 128:
+            raise ValueError("Roots could not be separated")
+        h = g.gcd(ModulusContext(g).trace(Polynom([0, 1 << i]), 128))
+        if 0 < h.degree() < g.degree():
+            rest, _ = g / h
+            work.extend([(h, i + 1), (rest, i + 1)])
+        else:
+            work.append((g, i + 1))
+    return sorted(found)
+
+
+def factor(polynom):
+    """
+    Factor a polynomial into monic irreducible factors with multiplicities.
+
+    Runs sff, then ddf and edf on every square-free factor. ddf hands the
+    Frobenius images X^(q^(2^i)) it computes anyway to edf, which reduces
+    them modulo each distinct degree factor instead of computing them
+    again. The square-free factors are processed in the worker pool once
+    their total degree reaches PARALLEL_MIN_DEGREE.
+
+    Args:
+        polynom: The polynomial, not zero.
+
+    Returns:
+        A list of dictionaries sorted by factor, each with
+        - 'factor': The coefficients of a monic irreducible factor
+        - 'exponent': Its multiplicity
+    """
+    f = polynom._normalize()
+    if f.degree() < 0:
+        raise ValueError("The zero polynomial has no factorization")
+    square_free = [(Polynom(item["factor"]), item["exponent"]) for item in sff(Polynom(f.gfpoly_makemonic()))]
+    if sum(b.degree() for b, _ in square_free) < PARALLEL_MIN_DEGREE:
+        factored = [_factor_square_free(item) for item in square_free]
+    else:
+        factored = parallel.parallel_map(_factor_square_free, square_free)
+    z = [{"factor": factor.int, "exponent": exponent}
+         for (_, exponent), factors in zip(square_free, factored) for factor in factors]
+    if z == []:
+        return []
+    return sort_polynomials_with_key(z, "exponent")
+
+
+def _factor_square_free(args):
+    """Pool task: the irreducible factors of one square-free factor (b, exponent)."""
+    b, _ = args
+    context = ModulusContext(b)
+    frobenius = []
+    factors = []
+    for item in ddf(b, context, frobenius=frobenius):
+        g = Polynom(item["factor"])
+        if g.degree() == item["degree"]:
+            factors.append(g)
+        else:
+            factors.extend(edf(g, item["degree"], frobenius=frobenius))
+    return factors
+
+
 def constr_ghash_poly(ciphertext, ad, tag):
     """
     Construct a GHASH polynomial from ciphertext, additional data, and tag.
@@ -216,7 +594,7 @@ def gcm_crack(poly1, poly2, ad_m1, ct_m1, tag_m1, ad_m3, ct_m3, m3_tag, fg_ct, f
     Perform a GCM (Galois/Counter Mode) cryptographic crack. We can achieve this full break because
     every input message was encrypted and authenticated with the same nonce.
 
-    This function factorizes the GHASH polynomial for two messages to recover the authentication key, then recovers eky_0
+    This function finds the roots of the GHASH polynomial for two messages to recover the authentication key, then recovers eky_0
     to authenticate a forged message.
 
     Args:
@@ -241,21 +619,6 @@ def gcm_crack(poly1, poly2, ad_m1, ct_m1, tag_m1, ad_m3, ct_m3, m3_tag, fg_ct, f
 
     ghash_poly = ghash_poly_.gfpoly_makemonic()
     ghash_poly = Polynom(ghash_poly)
-    
-    square_free_poly = sff(ghash_poly)
-
-    res = []
-    for _, entry in enumerate(square_free_poly):
-        ddf_poly = Polynom(entry['factor'])
-        dist_deg_poly = ddf(ddf_poly)
-        res.append(dist_deg_poly)
-    
-    edf_candidates = [
-        entry['factor']
-        for sublist in res
-        for entry in sublist
-        if entry['degree'] ==1
-    ]
 
     ad_blocks_m1 = pad_ad(ad_m1)
     ad_blocks_m3 = pad_ad(ad_m3)
@@ -266,29 +629,47 @@ def gcm_crack(poly1, poly2, ad_m1, ct_m1, tag_m1, ad_m3, ct_m3, m3_tag, fg_ct, f
     L_m1 = calc_l(ad_m1, ct_m1) 
     L_m3 = calc_l(ad_m3, ct_m3)
 
-    l_fe_m1 = FieldElement(int.from_bytes(L_m1, 'little'))
-    l_fe_m3 = FieldElement(int.from_bytes(L_m3, 'little'))
-
-    for candidate in edf_candidates:
-        edf_poly = Polynom(candidate)
-        res = edf(edf_poly, 1)
-        for polynom in res:
-            for element in polynom.int:
-                if element != 1:
-                    h = x.gcm_sem(element)
-                    h = FieldElement(h)
-                    ghash_res_ek = ghash(ad_blocks_m1, h, l_fe_m1, ct_m1_)
-                    tag = FieldElement(x.gcm_sem(int.from_bytes(tag_m1, 'little')))
-                    eky_0 = ghash_res_ek + tag
-                    ghash_m3 = ghash(ad_blocks_m3, h, l_fe_m3, ct_m3_)
-                    tag = ghash_m3 + eky_0
-                    
-                    if tag.element == m3_tag:
-                        L_fg = calc_l(fg_ad, fg_ct)
-                        ad_blocks_fg = pad_ad(fg_ad)
-                        ct_fg = pad_slice_ct(fg_ct)
-                        L_fg_fe = FieldElement(int.from_bytes(L_fg, 'little'))
-                        forgery_result = ghash(ad_blocks_fg, h, L_fg_fe, ct_fg)
-                        forgery_tag = forgery_result + eky_0
-                        return forgery_tag, h, eky_0
-    return None
+    # The candidate keys are the roots of the GHASH difference, all checked at once
+    candidates = roots(ghash_poly)
+    if not candidates:
+        return None
+
+    keys = FieldElementArray.from_ints(candidates)
+    tag = gcm_sem(int.from_bytes(tag_m1, 'little'))
+    eky_0_all = ghash_candidates(ad_blocks_m1, ct_m1_, L_m1, keys) + tag
+    tags = ghash_candidates(ad_blocks_m3, ct_m3_, L_m3, keys) + eky_0_all
+
+    index = tags.find(m3_tag)
+    if index < 0:
+        return None
+    h = FieldElement(x.gcm_sem(candidates[index]))
+    eky_0 = FieldElement(eky_0_all[index])
+    L_fg = calc_l(fg_ad, fg_ct)
+    ad_blocks_fg = pad_ad(fg_ad)
+    ct_fg = pad_slice_ct(fg_ct)
+    L_fg_fe = FieldElement(int.from_bytes(L_fg, 'little'))
+    forgery_result = ghash(ad_blocks_fg, h, L_fg_fe, ct_fg)
+    forgery_tag = forgery_result + eky_0
+    return forgery_tag, h, eky_0
+
+
+def ghash_candidates(associated_data_blocks, ct_blocks, l, keys):
+    """
+    Evaluate GHASH for many candidate authentication keys at once.
+
+    Horner's rule runs over the blocks once, with one element-wise product
+    per block across all keys.
+
+    Args:
+        associated_data_blocks: Padded associated data blocks
+        ct_blocks: Ciphertext blocks
+        l: Length block in bytes
+        keys: FieldElementArray of candidate keys in field element representation
+
+    Returns:
+        FieldElementArray of GHASH values in field element representation
+    """
+    acc = FieldElementArray.zeros(len(keys))
+    for block in [*associated_data_blocks, *ct_blocks, l]:
+        acc = (acc + gcm_sem(int.from_bytes(block.ljust(16, b'\x00'), 'little'))) * keys
+    return acc
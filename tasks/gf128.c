@@ -0,0 +1,492 @@
+/*
+ * GF(2^128) arithmetic kernel shared by tasks/polynom_perf.py and
+ * tasks/polynom.py. Built ahead of time by tasks/gf128_build.py.
+ *
+ * A field element is a uint64_t[2] with the low word first; bit i is the
+ * coefficient of x^i. Packed buffers store element i in words 2i and 2i+1.
+ */
+#include <stdint.h>
+#include <stddef.h>
+
+// Carry-less 64x64 -> 128 bit multiply using a 4-bit window on b.
+// The table holds a*i for i < 16; the top three bits of a are masked
+// off so that no table entry overflows 64 bits and are added back below.
+static inline void clmul64(uint64_t a, uint64_t b, uint64_t *lo, uint64_t *hi) {
+    uint64_t u[16];
+    uint64_t l, h, g, m;
+    const uint64_t a0 = a & 0x1FFFFFFFFFFFFFFFULL;
+    int i;
+
+    u[0]  = 0;
+    u[1]  = a0;
+    u[2]  = u[1] << 1;
+    u[3]  = u[2] ^ a0;
+    u[4]  = u[2] << 1;
+    u[5]  = u[4] ^ a0;
+    u[6]  = u[3] << 1;
+    u[7]  = u[6] ^ a0;
+    u[8]  = u[4] << 1;
+    u[9]  = u[8] ^ a0;
+    u[10] = u[5] << 1;
+    u[11] = u[10] ^ a0;
+    u[12] = u[6] << 1;
+    u[13] = u[12] ^ a0;
+    u[14] = u[7] << 1;
+    u[15] = u[14] ^ a0;
+
+    l = u[b & 15];
+    h = 0;
+    for (i = 4; i < 64; i += 4) {
+        g = u[(b >> i) & 15];
+        l ^= g << i;
+        h ^= g >> (64 - i);
+    }
+
+    // Branch-free correction for bits 61..63 of a
+    m = -((a >> 61) & 1);
+    l ^= (b << 61) & m;
+    h ^= (b >> 3) & m;
+    m = -((a >> 62) & 1);
+    l ^= (b << 62) & m;
+    h ^= (b >> 2) & m;
+    m = -((a >> 63) & 1);
+    l ^= (b << 63) & m;
+    h ^= (b >> 1) & m;
+
+    *lo = l;
+    *hi = h;
+}
+
+// 128x128 -> 256 bit carry-less multiply, Karatsuba split into
+// three 64x64 half products. p[0] is the lowest word.
+static inline void clmul128(const uint64_t a[2], const uint64_t b[2], uint64_t p[4]) {
+    uint64_t z0l, z0h, z2l, z2h, z1l, z1h;
+
+    clmul64(a[0], b[0], &z0l, &z0h);
+    clmul64(a[1], b[1], &z2l, &z2h);
+    clmul64(a[0] ^ a[1], b[0] ^ b[1], &z1l, &z1h);
+    z1l ^= z0l ^ z2l;
+    z1h ^= z0h ^ z2h;
+
+    p[0] = z0l;
+    p[1] = z0h ^ z1l;
+    p[2] = z2l ^ z1h;
+    p[3] = z2h;
+}
+
+// Word-level reduction by x^128 + x^7 + x^2 + x + 1.
+// x^128 = x^7 + x^2 + x + 1, so each high word is folded down twice.
+static inline void reduce_gcm(uint64_t p[4], uint64_t result[2]) {
+    p[2] ^= (p[3] >> 63) ^ (p[3] >> 62) ^ (p[3] >> 57);
+    p[1] ^= p[3] ^ (p[3] << 1) ^ (p[3] << 2) ^ (p[3] << 7);
+    p[1] ^= (p[2] >> 63) ^ (p[2] >> 62) ^ (p[2] >> 57);
+    p[0] ^= p[2] ^ (p[2] << 1) ^ (p[2] << 2) ^ (p[2] << 7);
+    result[0] = p[0];
+    result[1] = p[1];
+}
+
+// Bitwise reduction for any other reduction polynomial of degree 128.
+static void reduce_generic(uint64_t p[4], const uint64_t reduction[2], uint64_t result[2]) {
+    int bit;
+    for (bit = 255; bit >= 128; bit--) {
+        int word = (bit - 128) >> 6;
+        int off = (bit - 128) & 63;
+        if (!((p[bit >> 6] >> (bit & 63)) & 1)) {
+            continue;
+        }
+        p[bit >> 6] ^= 1ULL << (bit & 63);
+        p[word] ^= reduction[0] << off;
+        p[word + 1] ^= reduction[1] << off;
+        if (off) {
+            p[word + 1] ^= reduction[0] >> (64 - off);
+            p[word + 2] ^= reduction[1] >> (64 - off);
+        }
+    }
+    result[0] = p[0];
+    result[1] = p[1];
+}
+
+// Single multiply and squaring with GCM reduction
+static inline void gf_mul(const uint64_t a[2], const uint64_t b[2], uint64_t r[2]) {
+    uint64_t p[4];
+    clmul128(a, b, p);
+    reduce_gcm(p, r);
+}
+
+// Squaring is GF(2)-linear: spreading the bits of a to the even positions
+// gives the unreduced square, so only the reduction remains.
+static inline uint64_t spread32(uint64_t v) {
+    v &= 0x00000000FFFFFFFFULL;
+    v = (v | (v << 16)) & 0x0000FFFF0000FFFFULL;
+    v = (v | (v << 8))  & 0x00FF00FF00FF00FFULL;
+    v = (v | (v << 4))  & 0x0F0F0F0F0F0F0F0FULL;
+    v = (v | (v << 2))  & 0x3333333333333333ULL;
+    v = (v | (v << 1))  & 0x5555555555555555ULL;
+    return v;
+}
+
+// Inverse of spread32: gathers the even bits of v into the low 32 bits
+static inline uint64_t compress32(uint64_t v) {
+    v &= 0x5555555555555555ULL;
+    v = (v | (v >> 1))  & 0x3333333333333333ULL;
+    v = (v | (v >> 2))  & 0x0F0F0F0F0F0F0F0FULL;
+    v = (v | (v >> 4))  & 0x00FF00FF00FF00FFULL;
+    v = (v | (v >> 8))  & 0x0000FFFF0000FFFFULL;
+    v = (v | (v >> 16)) & 0x00000000FFFFFFFFULL;
+    return v;
+}
+
+static inline void gf_sqr(const uint64_t a[2], uint64_t r[2]) {
+    uint64_t p[4];
+    p[0] = spread32(a[0]);
+    p[1] = spread32(a[0] >> 32);
+    p[2] = spread32(a[1]);
+    p[3] = spread32(a[1] >> 32);
+    reduce_gcm(p, r);
+}
+
+static inline void gf_sqr_n(uint64_t a[2], int n) {
+    int i;
+    for (i = 0; i < n; i++) {
+        gf_sqr(a, a);
+    }
+}
+
+// sqrt(x) = x^(2^127) in GF(2^128)
+static const uint64_t SQRT_X[2] = {0x6db6db6db6db6da4ULL, 0x2492492492492492ULL};
+
+// With a = E(x)^2 + x * O(x)^2, where E and O collect the even and odd
+// coefficients of a, sqrt(a) = E(x) + sqrt(x) * O(x).
+static inline void gf_sqrt(const uint64_t a[2], uint64_t r[2]) {
+    uint64_t e[2], o[2], t[2];
+    e[0] = compress32(a[0]) | (compress32(a[1]) << 32);
+    e[1] = 0;
+    o[0] = compress32(a[0] >> 1) | (compress32(a[1] >> 1) << 32);
+    o[1] = 0;
+    gf_mul(o, SQRT_X, t);
+    r[0] = e[0] ^ t[0];
+    r[1] = t[1];
+}
+
+void gf2_128_mul(
+    const uint64_t a[2],
+    const uint64_t b[2],
+    const uint64_t reduction[2],
+    uint64_t result[2]
+) {
+    uint64_t p[4];
+    clmul128(a, b, p);
+    if (reduction[0] == 0x87 && reduction[1] == 0) {
+        reduce_gcm(p, result);
+    } else {
+        reduce_generic(p, reduction, result);
+    }
+}
+
+// Batched kernels on packed buffers. All of them use the GCM reduction
+// polynomial.
+
+void gf2_128_vec_mul(const uint64_t *a, const uint64_t *b, uint64_t *out, size_t n) {
+    uint64_t p[4];
+    size_t i;
+    for (i = 0; i < n; i++) {
+        clmul128(a + 2 * i, b + 2 * i, p);
+        reduce_gcm(p, out + 2 * i);
+    }
+}
+
+void gf2_128_scalar_mul(const uint64_t s[2], const uint64_t *v, uint64_t *out, size_t n) {
+    uint64_t p[4];
+    size_t i;
+    for (i = 0; i < n; i++) {
+        clmul128(s, v + 2 * i, p);
+        reduce_gcm(p, out + 2 * i);
+    }
+}
+
+void gf2_128_scalar_mul_add(const uint64_t s[2], const uint64_t *v, uint64_t *acc, size_t n) {
+    uint64_t p[4], r[2];
+    size_t i;
+    if (s[0] == 0 && s[1] == 0) {
+        return;
+    }
+    for (i = 0; i < n; i++) {
+        clmul128(s, v + 2 * i, p);
+        reduce_gcm(p, r);
+        acc[2 * i] ^= r[0];
+        acc[2 * i + 1] ^= r[1];
+    }
+}
+
+// Reduction is linear, so the unreduced 256 bit products are summed
+// first and reduced once at the end.
+void gf2_128_dot(const uint64_t *a, const uint64_t *b, size_t n, uint64_t result[2]) {
+    uint64_t p[4], sum[4] = {0, 0, 0, 0};
+    size_t i;
+    for (i = 0; i < n; i++) {
+        clmul128(a + 2 * i, b + 2 * i, p);
+        sum[0] ^= p[0];
+        sum[1] ^= p[1];
+        sum[2] ^= p[2];
+        sum[3] ^= p[3];
+    }
+    reduce_gcm(sum, result);
+}
+
+// Schoolbook product of two packed polynomials with na and nb coefficients
+// into out (na + nb - 1 coefficients). Each output coefficient is summed
+// unreduced and reduced once. out must not alias a or b.
+void gf2_128_poly_mul(const uint64_t *a, size_t na, const uint64_t *b, size_t nb, uint64_t *out) {
+    uint64_t sum[4], p[4];
+    size_t k, i, lo, hi;
+
+    // An empty factor gives an empty product; na - 1 would wrap around
+    if (na == 0 || nb == 0) {
+        return;
+    }
+    for (k = 0; k < na + nb - 1; k++) {
+        sum[0] = sum[1] = sum[2] = sum[3] = 0;
+        lo = k >= nb ? k - nb + 1 : 0;
+        hi = k < na ? k : na - 1;
+        for (i = lo; i <= hi; i++) {
+            clmul128(a + 2 * i, b + 2 * (k - i), p);
+            sum[0] ^= p[0];
+            sum[1] ^= p[1];
+            sum[2] ^= p[2];
+            sum[3] ^= p[3];
+        }
+        reduce_gcm(sum, out + 2 * k);
+    }
+}
+
+// Linear combination sum_j c[j] * rows[j] of m packed rows of n elements
+// each (row-major), with one reduction per output coefficient.
+void gf2_128_lincomb(const uint64_t *c, size_t m, const uint64_t *rows, size_t n, uint64_t *out) {
+    uint64_t sum[4], p[4];
+    size_t j, k;
+
+    for (k = 0; k < n; k++) {
+        sum[0] = sum[1] = sum[2] = sum[3] = 0;
+        for (j = 0; j < m; j++) {
+            clmul128(c + 2 * j, rows + 2 * (j * n + k), p);
+            sum[0] ^= p[0];
+            sum[1] ^= p[1];
+            sum[2] ^= p[2];
+            sum[3] ^= p[3];
+        }
+        reduce_gcm(sum, out + 2 * k);
+    }
+}
+
+// Itoh-Tsujii inversion: a^-1 = a^(2^128 - 2) = (a^(2^127 - 1))^2.
+// With b_k = a^(2^k - 1) and b_(j+k) = b_j^(2^k) * b_k, the addition chain
+// 1, 2, 3, 6, 7, 14, 15, 30, 31, 62, 63, 126, 127 needs 12 multiplications
+// and 127 squarings. The inverse of 0 is returned as 0.
+void gf2_128_inv(const uint64_t a[2], uint64_t result[2]) {
+    static const int chain[6] = {1, 3, 7, 15, 31, 63};
+    uint64_t b[2], t[2];
+    int i;
+
+    b[0] = a[0];
+    b[1] = a[1];
+    for (i = 0; i < 6; i++) {
+        // b_k -> b_2k
+        t[0] = b[0];
+        t[1] = b[1];
+        gf_sqr_n(t, chain[i]);
+        gf_mul(t, b, b);
+        // b_2k -> b_(2k+1)
+        gf_sqr_n(b, 1);
+        gf_mul(b, a, b);
+    }
+    gf_sqr_n(b, 1);
+    result[0] = b[0];
+    result[1] = b[1];
+}
+
+// Montgomery batch inversion: one inversion and 3(n-1) multiplications for
+// n elements. out must not alias a. Zero elements map to zero.
+void gf2_128_batch_inv(const uint64_t *a, uint64_t *out, size_t n) {
+    uint64_t acc[2] = {1, 0}, inv[2];
+    size_t i;
+
+    // out[i] = product of the non-zero a[0..i-1]; zero inputs are marked by
+    // a zero prefix, which can not occur otherwise
+    for (i = 0; i < n; i++) {
+        if (a[2 * i] | a[2 * i + 1]) {
+            out[2 * i] = acc[0];
+            out[2 * i + 1] = acc[1];
+            gf_mul(acc, a + 2 * i, acc);
+        } else {
+            out[2 * i] = 0;
+            out[2 * i + 1] = 0;
+        }
+    }
+    gf2_128_inv(acc, inv);
+
+    // Walk back with inv = (product of the non-zero a[0..i])^-1:
+    // a[i]^-1 = prefix[i] * inv, then drop a[i] from inv
+    for (i = n; i-- > 0;) {
+        if (!(out[2 * i] | out[2 * i + 1])) {
+            continue;
+        }
+        gf_mul(out + 2 * i, inv, out + 2 * i);
+        gf_mul(inv, a + 2 * i, inv);
+    }
+}
+
+void gf2_128_sqr(const uint64_t a[2], uint64_t result[2]) {
+    gf_sqr(a, result);
+}
+
+void gf2_128_sqrt(const uint64_t a[2], uint64_t result[2]) {
+    gf_sqrt(a, result);
+}
+
+void gf2_128_vec_sqr(const uint64_t *a, uint64_t *out, size_t n) {
+    size_t i;
+    for (i = 0; i < n; i++) {
+        gf_sqr(a + 2 * i, out + 2 * i);
+    }
+}
+
+void gf2_128_vec_sqrt(const uint64_t *a, uint64_t *out, size_t n) {
+    size_t i;
+    for (i = 0; i < n; i++) {
+        gf_sqrt(a + 2 * i, out + 2 * i);
+    }
+}
+
+// Multiplication in the bit-reflected GCM representation, as hardware
+// GHASH does it. a and b hold a GCM block read as a big-endian integer
+// (low word first), so bit 127 is the coefficient of x^0.
+//
+// The carry-less product of two reflected values is the reflected product
+// shifted right by one, hence the shift by one below. Multiplying by x^k is
+// a right shift by k in this domain, so the reduction folds the low half T
+// into the high half as T ^ T>>1 ^ T>>2 ^ T>>7. The bits shifted out below
+// the high half (T<<127, T<<126, T<<121) are folded once more.
+void gf2_128_mul_gcm(const uint64_t a[2], const uint64_t b[2], uint64_t result[2]) {
+    uint64_t p[4], t0, t1, s, r0, r1;
+
+    clmul128(a, b, p);
+    p[3] = (p[3] << 1) | (p[2] >> 63);
+    p[2] = (p[2] << 1) | (p[1] >> 63);
+    p[1] = (p[1] << 1) | (p[0] >> 63);
+    p[0] = p[0] << 1;
+
+    t0 = p[0];
+    t1 = p[1];
+    r0 = p[2] ^ t0 ^ ((t0 >> 1) | (t1 << 63)) ^ ((t0 >> 2) | (t1 << 62)) ^ ((t0 >> 7) | (t1 << 57));
+    r1 = p[3] ^ t1 ^ (t1 >> 1) ^ (t1 >> 2) ^ (t1 >> 7);
+
+    // Spill of the first fold; it only occupies the top word of the low half,
+    // so folding it again spills nothing
+    s = (t0 << 63) ^ (t0 << 62) ^ (t0 << 57);
+    r0 ^= (s << 63) ^ (s << 62) ^ (s << 57);
+    r1 ^= s ^ (s >> 1) ^ (s >> 2) ^ (s >> 7);
+
+    result[0] = r0;
+    result[1] = r1;
+}
+
+// Tower field GF((2^64)^2): GF(2^64) = GF(2)[t]/(t^64 + t^4 + t^3 + t + 1)
+// and GF(2^128) = GF(2^64)[y]/(y^2 + y + t^63). A tower element a0 + a1*y
+// is a uint64_t[2] {a0, a1}. tasks/gf128_tower.py maps between this and the
+// GCM polynomial basis with gf2_128_linear_map.
+
+// Reduction by t^64 + t^4 + t^3 + t + 1; the first fold spills at most
+// four bits, which the second fold absorbs.
+static inline uint64_t gf64_reduce(uint64_t lo, uint64_t hi) {
+    uint64_t s = (hi >> 63) ^ (hi >> 61) ^ (hi >> 60);
+    lo ^= hi ^ (hi << 1) ^ (hi << 3) ^ (hi << 4);
+    return lo ^ s ^ (s << 1) ^ (s << 3) ^ (s << 4);
+}
+
+static inline uint64_t gf64_mul(uint64_t a, uint64_t b) {
+    uint64_t lo, hi;
+    clmul64(a, b, &lo, &hi);
+    return gf64_reduce(lo, hi);
+}
+
+static inline uint64_t gf64_sqr(uint64_t a) {
+    return gf64_reduce(spread32(a), spread32(a >> 32));
+}
+
+// Multiplication by the tower constant beta = t^63 is a shift
+static inline uint64_t gf64_mul_beta(uint64_t a) {
+    return gf64_reduce(a << 63, a >> 1);
+}
+
+// Itoh-Tsujii in GF(2^64): a^-1 = (a^(2^63 - 1))^2 along the chain
+// 1, 2, 3, 6, 7, 14, 15, 30, 31, 62, 63.
+static uint64_t gf64_inv(uint64_t a) {
+    static const int chain[5] = {1, 3, 7, 15, 31};
+    uint64_t b = a, t;
+    int i, j;
+
+    for (i = 0; i < 5; i++) {
+        t = b;
+        for (j = 0; j < chain[i]; j++) {
+            t = gf64_sqr(t);
+        }
+        b = gf64_mul(t, b);
+        b = gf64_mul(gf64_sqr(b), a);
+    }
+    return gf64_sqr(b);
+}
+
+// (a0 + a1 y)(b0 + b1 y) with y^2 = y + beta, in three GF(2^64) products:
+// a0 b0 + beta a1 b1 + ((a0 + a1)(b0 + b1) + a0 b0) y
+void gf2_128_tower_mul(const uint64_t a[2], const uint64_t b[2], uint64_t result[2]) {
+    uint64_t m0 = gf64_mul(a[0], b[0]);
+    uint64_t m1 = gf64_mul(a[1], b[1]);
+    uint64_t m2 = gf64_mul(a[0] ^ a[1], b[0] ^ b[1]);
+    result[0] = m0 ^ gf64_mul_beta(m1);
+    result[1] = m2 ^ m0;
+}
+
+// The conjugate of a0 + a1 y is (a0 + a1) + a1 y, and their product is the
+// norm a0^2 + a0 a1 + beta a1^2 in GF(2^64). One GF(2^64) inversion of the
+// norm gives the inverse. The inverse of 0 is returned as 0.
+void gf2_128_tower_inv(const uint64_t a[2], uint64_t result[2]) {
+    uint64_t norm = gf64_sqr(a[0]) ^ gf64_mul(a[0], a[1]) ^ gf64_mul_beta(gf64_sqr(a[1]));
+    uint64_t inv = gf64_inv(norm);
+    result[0] = gf64_mul(a[0] ^ a[1], inv);
+    result[1] = gf64_mul(a[1], inv);
+}
+
+// GF(2)-linear map of a 128-bit value through a table of 16 x 256 entries:
+// entry (k, v) is the image of byte k having value v.
+void gf2_128_linear_map(const uint64_t *table, const uint64_t a[2], uint64_t result[2]) {
+    uint64_t r0 = 0, r1 = 0;
+    const uint64_t *entry;
+    int k;
+
+    for (k = 0; k < 16; k++) {
+        entry = table + 2 * (256 * k + ((a[k >> 3] >> (8 * (k & 7))) & 0xFF));
+        r0 ^= entry[0];
+        r1 ^= entry[1];
+    }
+    result[0] = r0;
+    result[1] = r1;
+}
+
+// Tower arithmetic on elements given in the GCM basis: map in, operate and
+// map back in one call. to_tower and from_tower are gf2_128_linear_map tables.
+void gf2_128_tower_mul_mapped(const uint64_t *to_tower, const uint64_t *from_tower,
+                              const uint64_t a[2], const uint64_t b[2], uint64_t result[2]) {
+    uint64_t ta[2], tb[2], tr[2];
+    gf2_128_linear_map(to_tower, a, ta);
+    gf2_128_linear_map(to_tower, b, tb);
+    gf2_128_tower_mul(ta, tb, tr);
+    gf2_128_linear_map(from_tower, tr, result);
+}
+
+void gf2_128_tower_inv_mapped(const uint64_t *to_tower, const uint64_t *from_tower,
+                              const uint64_t a[2], uint64_t result[2]) {
+    uint64_t ta[2], tr[2];
+    gf2_128_linear_map(to_tower, a, ta);
+    gf2_128_tower_inv(ta, tr);
+    gf2_128_linear_map(from_tower, tr, result);
+}
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+GF(2^128) arithmetic backend.
+
+Loads the ahead-of-time compiled cffi extension tasks._gf128. If it has not
+been built or was built from other sources, the kernel is compiled once
+into a versioned cache directory (KAUMA_CACHE_DIR, default ~/.cache/kauma)
+and reused by every later process.
+Without cffi or a C compiler, a pure Python implementation with the same
+interface is used instead.
+
+Field elements are 128-bit integers where bit i is the coefficient of x^i.
+Vectors are packed buffers of 16 little-endian bytes per element.
+
+KAUMA_GF_BACKEND=tower routes single multiplications and inversions through
+the experimental tower field representation in tasks/gf128_tower.py.
+"""
+import importlib.util
+import os
+import tempfile
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+MASK_128 = (1 << 128) - 1
+GCM_REDUCTION = 0x87
+# sqrt(x) = x^(2^127) for the GCM polynomial
+SQRT_X = 0x24924924924924926db6db6db6db6da4
+# Tower field GF((2^64)^2): GF(2^64) modulo t^64 + t^4 + t^3 + t + 1,
+# GF(2^128) modulo y^2 + y + TOWER_BETA over it
+GF64_REDUCTION = 0x1B
+TOWER_BETA = 1 << 63
+
+
+def _cache_dir() -> str:
+    """Return the directory holding cached kernel builds."""
+    default = os.path.join(os.path.expanduser("~"), ".cache", "kauma")
+    return os.environ.get("KAUMA_CACHE_DIR", default)
+
+
+def _load_from_cache():
+    """
+    Import the kernel from the versioned cache, building it there if needed.
+
+    The artifact name contains a hash of the source, flags and interpreter
+    ABI. Builds happen in a temporary directory and are moved into place
+    atomically, so concurrent worker processes never see a partial file.
+    """
+    from tasks import gf128_build
+
+    module_name = f"_gf128_{gf128_build.source_hash()}"
+    cache_dir = _cache_dir()
+    artifact = None
+    if os.path.isdir(cache_dir):
+        for name in os.listdir(cache_dir):
+            if name.startswith(module_name + "."):
+                artifact = os.path.join(cache_dir, name)
+                break
+
+    if artifact is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=cache_dir) as tmpdir:
+            built = gf128_build.make_ffibuilder(module_name).compile(tmpdir=tmpdir, verbose=False)
+            artifact = os.path.join(cache_dir, os.path.basename(built))
+            os.replace(built, artifact)
+
+    spec = importlib.util.spec_from_file_location(module_name, artifact)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ffi, module.lib
+
+
+def _load_native():
+    """Return (ffi, lib) for the compiled kernel, or (None, None)."""
+    try:
+        from tasks._gf128 import ffi, lib
+        from tasks import gf128_build
+        # An in-tree build from an older checkout lacks newer functions
+        if (hasattr(lib, "gf2_128_build_hash")
+                and ffi.string(lib.gf2_128_build_hash()).decode() == gf128_build.source_hash()):
+            return ffi, lib
+    except ImportError:
+        pass
+    try:
+        return _load_from_cache()
+    except Exception:
+        # No cffi, no compiler or an unwritable cache: use pure Python
+        return None, None
+
+
+ffi, lib = (None, None) if os.environ.get("KAUMA_PURE_PYTHON") else _load_native()
+NATIVE = lib is not None
+
+
+def reflect(x: int) -> int:
+    """Reverse the 128 bits of x, mapping between GCM block and field element."""
+    return int(format(x, '0128b')[::-1], 2)
+
+
+def pack(values) -> bytearray:
+    """Pack 128-bit integers into a buffer of 16 little-endian bytes each."""
+    return bytearray(b''.join(v.to_bytes(16, 'little') for v in values))
+
+
+def unpack(buf) -> list:
+    """Unpack a buffer produced by pack back into a list of integers."""
+    buf = bytes(buf)
+    return [int.from_bytes(buf[i:i + 16], 'little') for i in range(0, len(buf), 16)]
+
+
+class _NativeKernel:
+    """Field arithmetic through the compiled cffi extension."""
+
+    def __init__(self, ffi, lib):
+        self.ffi = ffi
+        self.lib = lib
+        self._gcm_reduction = ffi.new("uint64_t[2]", [GCM_REDUCTION, 0])
+
+    def _scalar(self, x: int):
+        return self.ffi.new("uint64_t[2]", [x & MASK_64, x >> 64])
+
+    def view(self, buf):
+        """Return a handle on a packed buffer that the other methods accept."""
+        return self.ffi.from_buffer("uint64_t[]", buf)
+
+    def mul(self, x: int, y: int, reduction: int = GCM_REDUCTION) -> int:
+        """Multiply x and y modulo x^128 + reduction."""
+        if reduction == GCM_REDUCTION:
+            r_arr = self._gcm_reduction
+        else:
+            r_arr = self._scalar(reduction)
+        p_arr = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_mul(self._scalar(x), self._scalar(y), r_arr, p_arr)
+        return p_arr[0] | (p_arr[1] << 64)
+
+    def vec_mul(self, a, b, n: int) -> bytearray:
+        """Element-wise product of two packed vectors of length n."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_vec_mul(self.view(a), self.view(b), self.view(out), n)
+        return out
+
+    def scalar_mul(self, s: int, v, n: int) -> bytearray:
+        """Product of the scalar s with each element of a packed vector."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_scalar_mul(self._scalar(s), self.view(v), self.view(out), n)
+        return out
+
+    def scalar_mul_add(self, s: int, v, acc, offset: int, n: int):
+        """In place acc[offset:offset+n] ^= s * v[0:n] on view handles."""
+        self.lib.gf2_128_scalar_mul_add(self._scalar(s), v, acc + 2 * offset, n)
+
+    def dot(self, a, b, n: int) -> int:
+        """Sum of a[i] * b[i] over two packed vectors of length n."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_dot(self.view(a), self.view(b), n, result)
+        return result[0] | (result[1] << 64)
+
+    def poly_mul(self, a, na: int, b, nb: int) -> bytearray:
+        """Schoolbook product of two packed polynomials, one reduction per coefficient."""
+        if na == 0 or nb == 0:
+            return bytearray()
+        out = bytearray(16 * (na + nb - 1))
+        self.lib.gf2_128_poly_mul(self.view(a), na, self.view(b), nb, self.view(out))
+        return out
+
+    def lincomb(self, c, m: int, rows, n: int) -> bytearray:
+        """Sum of c[j] * rows[j] over m packed rows of n elements each."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_lincomb(self.view(c), m, self.view(rows), n, self.view(out))
+        return out
+
+    def inv(self, x: int) -> int:
+        """Multiplicative inverse of x (Itoh-Tsujii); the inverse of 0 is 0."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_inv(self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+    def batch_inv(self, a, n: int) -> bytearray:
+        """Inverses of a packed vector with a single inversion (Montgomery's trick)."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_batch_inv(self.view(a), self.view(out), n)
+        return out
+
+    def sqr(self, x: int) -> int:
+        """Square of x via bit spreading and reduction."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_sqr(self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+    def sqrt(self, x: int) -> int:
+        """Square root of x via the even/odd bit split."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_sqrt(self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+    def mul_gcm(self, x: int, y: int) -> int:
+        """Multiply two GCM blocks read as big-endian integers (reflected domain)."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_mul_gcm(self._scalar(x), self._scalar(y), result)
+        return result[0] | (result[1] << 64)
+
+    def vec_sqr(self, a, n: int) -> bytearray:
+        """Squares of a packed vector."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_vec_sqr(self.view(a), self.view(out), n)
+        return out
+
+    def vec_sqrt(self, a, n: int) -> bytearray:
+        """Square roots of a packed vector."""
+        out = bytearray(16 * n)
+        self.lib.gf2_128_vec_sqrt(self.view(a), self.view(out), n)
+        return out
+
+    def tower_mul(self, x: int, y: int) -> int:
+        """Multiply two elements in the tower representation GF((2^64)^2)."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_tower_mul(self._scalar(x), self._scalar(y), result)
+        return result[0] | (result[1] << 64)
+
+    def tower_inv(self, x: int) -> int:
+        """Inverse in the tower representation via one GF(2^64) inversion of the norm."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_tower_inv(self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+    def linear_map(self, table, x: int) -> int:
+        """Apply a GF(2)-linear map given as a view on a packed 16 x 256 byte table."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_linear_map(table, self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+    def tower_mul_mapped(self, to_tower, from_tower, x: int, y: int) -> int:
+        """Multiply GCM basis elements through the tower in a single call."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_tower_mul_mapped(to_tower, from_tower, self._scalar(x), self._scalar(y), result)
+        return result[0] | (result[1] << 64)
+
+    def tower_inv_mapped(self, to_tower, from_tower, x: int) -> int:
+        """Invert a GCM basis element through the tower in a single call."""
+        result = self.ffi.new("uint64_t[2]")
+        self.lib.gf2_128_tower_inv_mapped(to_tower, from_tower, self._scalar(x), result)
+        return result[0] | (result[1] << 64)
+
+
+def _clmul(a: int, b: int) -> int:
+    """Carry-less product of two integers."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    return result
+
+
+def _reduce(p: int, reduction: int = GCM_REDUCTION) -> int:
+    """Reduce a carry-less product modulo x^128 + reduction."""
+    while p >> 128:
+        high = p >> 128
+        p = (p & MASK_128) ^ _clmul(high, reduction)
+    return p
+
+
+def _gf64_mul(a: int, b: int) -> int:
+    """Multiply in GF(2^64) modulo t^64 + t^4 + t^3 + t + 1."""
+    return _reduce64(_clmul(a, b))
+
+
+def _reduce64(p: int) -> int:
+    while p >> 64:
+        p = (p & MASK_64) ^ _clmul(p >> 64, GF64_REDUCTION)
+    return p
+
+
+def _gf64_inv(a: int) -> int:
+    """Inverse in GF(2^64) as a^(2^64 - 2); the inverse of 0 is 0."""
+    result, base = 1, a
+    for _ in range(63):
+        base = _gf64_mul(base, base)
+        result = _gf64_mul(result, base)
+    return result
+
+
+class _PythonKernel:
+    """Pure Python field arithmetic with the same interface as _NativeKernel."""
+
+    def view(self, buf):
+        return buf
+
+    def _get(self, buf, i: int) -> int:
+        return int.from_bytes(buf[16 * i:16 * i + 16], 'little')
+
+    def mul(self, x: int, y: int, reduction: int = GCM_REDUCTION) -> int:
+        return _reduce(_clmul(x, y), reduction)
+
+    def vec_mul(self, a, b, n: int) -> bytearray:
+        return pack(self.mul(self._get(a, i), self._get(b, i)) for i in range(n))
+
+    def scalar_mul(self, s: int, v, n: int) -> bytearray:
+        return pack(self.mul(s, self._get(v, i)) for i in range(n))
+
+    def scalar_mul_add(self, s: int, v, acc, offset: int, n: int):
+        if s == 0:
+            return
+        for i in range(n):
+            value = self._get(acc, offset + i) ^ self.mul(s, self._get(v, i))
+            acc[16 * (offset + i):16 * (offset + i + 1)] = value.to_bytes(16, 'little')
+
+    def dot(self, a, b, n: int) -> int:
+        total = 0
+        for i in range(n):
+            total ^= _clmul(self._get(a, i), self._get(b, i))
+        return _reduce(total)
+
+    def poly_mul(self, a, na: int, b, nb: int) -> bytearray:
+        if na == 0 or nb == 0:
+            return bytearray()
+        a_coeffs = [self._get(a, i) for i in range(na)]
+        b_coeffs = [self._get(b, j) for j in range(nb)]
+        sums = [0] * (na + nb - 1)
+        for i, x in enumerate(a_coeffs):
+            if x:
+                for j, y in enumerate(b_coeffs):
+                    sums[i + j] ^= _clmul(x, y)
+        return pack(_reduce(total) for total in sums)
+
+    def lincomb(self, c, m: int, rows, n: int) -> bytearray:
+        sums = [0] * n
+        for j in range(m):
+            s = self._get(c, j)
+            if s:
+                for k in range(n):
+                    sums[k] ^= _clmul(s, self._get(rows, j * n + k))
+        return pack(_reduce(total) for total in sums)
+
+    def inv(self, x: int) -> int:
+        # Binary extended Euclid against x^128 + x^7 + x^2 + x + 1
+        if x == 0:
+            return 0
+        u, v = x, (1 << 128) | GCM_REDUCTION
+        g1, g2 = 1, 0
+        while u != 1:
+            if u.bit_length() < v.bit_length():
+                u, v = v, u
+                g1, g2 = g2, g1
+            shift = u.bit_length() - v.bit_length()
+            u ^= v << shift
+            g1 ^= g2 << shift
+        return g1
+
+    def batch_inv(self, a, n: int) -> bytearray:
+        values = [self._get(a, i) for i in range(n)]
+        prefix = []
+        acc = 1
+        for value in values:
+            prefix.append(acc)
+            if value:
+                acc = self.mul(acc, value)
+        inv = self.inv(acc)
+        result = [0] * n
+        for i in reversed(range(n)):
+            if values[i]:
+                result[i] = self.mul(prefix[i], inv)
+                inv = self.mul(inv, values[i])
+        return pack(result)
+
+    def sqr(self, x: int) -> int:
+        return self.mul(x, x)
+
+    def sqrt(self, x: int) -> int:
+        even = odd = 0
+        for i in range(64):
+            even |= ((x >> (2 * i)) & 1) << i
+            odd |= ((x >> (2 * i + 1)) & 1) << i
+        return even ^ self.mul(odd, SQRT_X)
+
+    def mul_gcm(self, x: int, y: int) -> int:
+        return reflect(self.mul(reflect(x), reflect(y)))
+
+    def vec_sqr(self, a, n: int) -> bytearray:
+        return pack(self.sqr(self._get(a, i)) for i in range(n))
+
+    def vec_sqrt(self, a, n: int) -> bytearray:
+        return pack(self.sqrt(self._get(a, i)) for i in range(n))
+
+    def tower_mul(self, x: int, y: int) -> int:
+        a0, a1, b0, b1 = x & MASK_64, x >> 64, y & MASK_64, y >> 64
+        m0 = _gf64_mul(a0, b0)
+        m1 = _gf64_mul(a1, b1)
+        m2 = _gf64_mul(a0 ^ a1, b0 ^ b1)
+        return (m0 ^ _gf64_mul(m1, TOWER_BETA)) | ((m2 ^ m0) << 64)
+
+    def tower_inv(self, x: int) -> int:
+        a0, a1 = x & MASK_64, x >> 64
+        norm = _gf64_mul(a0, a0) ^ _gf64_mul(a0, a1) ^ _gf64_mul(TOWER_BETA, _gf64_mul(a1, a1))
+        inv = _gf64_inv(norm)
+        return _gf64_mul(a0 ^ a1, inv) | (_gf64_mul(a1, inv) << 64)
+
+    def linear_map(self, table, x: int) -> int:
+        result = 0
+        for k in range(16):
+            result ^= self._get(table, 256 * k + ((x >> (8 * k)) & 0xFF))
+        return result
+
+    def tower_mul_mapped(self, to_tower, from_tower, x: int, y: int) -> int:
+        product = self.tower_mul(self.linear_map(to_tower, x), self.linear_map(to_tower, y))
+        return self.linear_map(from_tower, product)
+
+    def tower_inv_mapped(self, to_tower, from_tower, x: int) -> int:
+        return self.linear_map(from_tower, self.tower_inv(self.linear_map(to_tower, x)))
+
+
+def _select_backend(base):
+    """Wrap the base kernel as requested by KAUMA_GF_BACKEND (poly or tower)."""
+    backend = os.environ.get("KAUMA_GF_BACKEND", "poly")
+    if backend == "poly":
+        return base
+    if backend == "tower":
+        from tasks.gf128_tower import TowerKernel
+        return TowerKernel(base)
+    raise ValueError(f"Unknown KAUMA_GF_BACKEND: {backend}")
+
+
+kernel = _select_backend(_NativeKernel(ffi, lib) if NATIVE else _PythonKernel())
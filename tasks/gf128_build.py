@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the GF(2^128) cffi extension (API mode).
+
+Running this file compiles tasks/gf128.c into tasks/_gf128.*.so next to
+the sources. The poetry build runs it at install time; tasks/gf128.py
+falls back to a versioned cache or to pure Python if the module is missing.
+
+Usage:
+    python3 tasks/gf128_build.py
+"""
+import hashlib
+import os
+import shutil
+import sys
+import sysconfig
+import tempfile
+
+from cffi import FFI
+
+MODULE_NAME = "tasks._gf128"
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gf128.c")
+EXTRA_COMPILE_ARGS = ["-O3", "-std=c99"]
+
+CDEF = """
+    void gf2_128_mul(
+        const uint64_t a[2],
+        const uint64_t b[2],
+        const uint64_t reduction[2],
+        uint64_t result[2]
+    );
+    void gf2_128_vec_mul(const uint64_t *a, const uint64_t *b, uint64_t *out, size_t n);
+    void gf2_128_scalar_mul(const uint64_t s[2], const uint64_t *v, uint64_t *out, size_t n);
+    void gf2_128_scalar_mul_add(const uint64_t s[2], const uint64_t *v, uint64_t *acc, size_t n);
+    void gf2_128_dot(const uint64_t *a, const uint64_t *b, size_t n, uint64_t result[2]);
+    void gf2_128_poly_mul(const uint64_t *a, size_t na, const uint64_t *b, size_t nb, uint64_t *out);
+    void gf2_128_lincomb(const uint64_t *c, size_t m, const uint64_t *rows, size_t n, uint64_t *out);
+    void gf2_128_inv(const uint64_t a[2], uint64_t result[2]);
+    void gf2_128_batch_inv(const uint64_t *a, uint64_t *out, size_t n);
+    void gf2_128_sqr(const uint64_t a[2], uint64_t result[2]);
+    void gf2_128_sqrt(const uint64_t a[2], uint64_t result[2]);
+    void gf2_128_vec_sqr(const uint64_t *a, uint64_t *out, size_t n);
+    void gf2_128_vec_sqrt(const uint64_t *a, uint64_t *out, size_t n);
+    void gf2_128_mul_gcm(const uint64_t a[2], const uint64_t b[2], uint64_t result[2]);
+    void gf2_128_tower_mul(const uint64_t a[2], const uint64_t b[2], uint64_t result[2]);
+    void gf2_128_tower_inv(const uint64_t a[2], uint64_t result[2]);
+    void gf2_128_linear_map(const uint64_t *table, const uint64_t a[2], uint64_t result[2]);
+    void gf2_128_tower_mul_mapped(const uint64_t *to_tower, const uint64_t *from_tower,
+                                  const uint64_t a[2], const uint64_t b[2], uint64_t result[2]);
+    void gf2_128_tower_inv_mapped(const uint64_t *to_tower, const uint64_t *from_tower,
+                                  const uint64_t a[2], uint64_t result[2]);
+"""
+
+# Reports the source_hash the module was built from, so stale in-tree
+# builds can be told apart from the current sources
+HASH_CDEF = """
+    const char *gf2_128_build_hash(void);
+"""
+
+
+def read_source() -> str:
+    """Return the C source of the kernel."""
+    with open(SOURCE_PATH, "r") as file:
+        return file.read()
+
+
+def source_hash() -> str:
+    """
+    Return a short hash identifying this build of the kernel.
+
+    Covers the C source, the cdef, the compiler flags and the interpreter ABI,
+    so a cached artifact is never reused across incompatible builds.
+    """
+    digest = hashlib.sha256()
+    for part in (CDEF, read_source(), " ".join(EXTRA_COMPILE_ARGS),
+                 sys.implementation.cache_tag, sysconfig.get_config_var("EXT_SUFFIX") or ""):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def make_ffibuilder(module_name=MODULE_NAME) -> FFI:
+    """Create an FFI builder for the kernel under the given module name."""
+    ffibuilder = FFI()
+    ffibuilder.cdef(CDEF + HASH_CDEF)
+    source = read_source() + f'\nconst char *gf2_128_build_hash(void) {{ return "{source_hash()}"; }}\n'
+    ffibuilder.set_source(module_name, source, extra_compile_args=EXTRA_COMPILE_ARGS)
+    return ffibuilder
+
+
+def build(setup_kwargs=None):
+    """
+    Compile the extension in place next to the sources.
+
+    Accepts the setup_kwargs argument poetry passes to build scripts.
+    """
+    target_dir = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        artifact = make_ffibuilder().compile(tmpdir=tmpdir, verbose=False)
+        shutil.copy2(artifact, os.path.join(target_dir, os.path.basename(artifact)))
+    return setup_kwargs
+
+
+if __name__ == "__main__":
+    build()
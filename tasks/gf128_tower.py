@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tower field backend for GF(2^128).
+
+Represents GF(2^128) as GF((2^64)^2): GF(2^64) = GF(2)[t]/(t^64 + t^4 + t^3 + t + 1)
+and GF(2^128) = GF(2^64)[y]/(y^2 + y + t^63). A tower element a0 + a1*y is
+stored as the integer a0 | a1 << 64. Multiplication needs three GF(2^64)
+products and inversion a single GF(2^64) inversion of the norm.
+
+The isomorphism to the GCM polynomial basis sends t to TAU and y to SIGMA.
+Both directions are 128x128 bit matrices, applied through 16 x 256 entry
+byte tables by the kernel.
+
+Select the backend with KAUMA_GF_BACKEND=tower. The kernel interface keeps
+working on GCM basis elements; only single multiplications and inversions
+take the detour through the tower, vector operations stay on the base kernel.
+"""
+from tasks.gf128 import GCM_REDUCTION, pack
+
+# Roots in the GCM field (polynomial basis) of t^64 + t^4 + t^3 + t + 1 and
+# of y^2 + y + TAU^63, found once with trace-based root splitting
+TAU = 0xa69a4f40a1109d7e579bda638e9568a1
+SIGMA = 0x0d6d5e8e49a580a11173f47500046b92
+
+
+def tower_basis_images(kernel) -> list:
+    """
+    Return the GCM basis images of the tower basis bits.
+
+    Bit i < 64 is t^i, bit 64 + i is t^i * y.
+    """
+    images = []
+    power = 1
+    for _ in range(64):
+        images.append(power)
+        power = kernel.mul(power, TAU)
+    return images + [kernel.mul(image, SIGMA) for image in images]
+
+
+def invert_images(images: list) -> list:
+    """
+    Invert a bijective GF(2)-linear map given by the images of the basis bits.
+
+    Gauss-Jordan elimination turns the images into unit vectors while
+    applying the same row operations to the preimages.
+
+    :param images: 128 integers, the image of bit i at index i.
+    :return: The preimage of bit i at index i.
+    """
+    rows = [(image, 1 << i) for i, image in enumerate(images)]
+    for bit in range(128):
+        pivot = next((r for r in range(bit, 128) if (rows[r][0] >> bit) & 1), None)
+        if pivot is None:
+            raise ValueError("Linear map is not invertible")
+        rows[bit], rows[pivot] = rows[pivot], rows[bit]
+        image, preimage = rows[bit]
+        for r in range(128):
+            if r != bit and (rows[r][0] >> bit) & 1:
+                rows[r] = (rows[r][0] ^ image, rows[r][1] ^ preimage)
+    return [preimage for _, preimage in rows]
+
+
+def byte_tables(images: list) -> bytearray:
+    """
+    Expand the images of the 128 basis bits into the packed 16 x 256 table
+    read by the kernel's linear_map: entry (k, v) is the image of byte k = v.
+    """
+    table = []
+    for k in range(16):
+        row = [0] * 256
+        for v in range(1, 256):
+            low = v & -v
+            row[v] = row[v ^ low] ^ images[8 * k + low.bit_length() - 1]
+        table.extend(row)
+    return pack(table)
+
+
+class TowerKernel:
+    """
+    Kernel wrapper that multiplies and inverts in the tower field.
+
+    Elements at the interface stay in the GCM polynomial basis. Everything
+    except mul with the GCM reduction and inv is delegated to the base kernel.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        images = tower_basis_images(base)
+        self._to_gcm_table = byte_tables(images)
+        self._to_tower_table = byte_tables(invert_images(images))
+        self._to_gcm = base.view(self._to_gcm_table)
+        self._to_tower = base.view(self._to_tower_table)
+
+    def __getattr__(self, name):
+        return getattr(self.base, name)
+
+    def to_tower(self, x: int) -> int:
+        """Map a GCM basis element to the tower representation."""
+        return self.base.linear_map(self._to_tower, x)
+
+    def from_tower(self, x: int) -> int:
+        """Map a tower element back to the GCM basis."""
+        return self.base.linear_map(self._to_gcm, x)
+
+    def mul(self, x: int, y: int, reduction: int = GCM_REDUCTION) -> int:
+        if reduction != GCM_REDUCTION:
+            return self.base.mul(x, y, reduction)
+        return self.base.tower_mul_mapped(self._to_tower, self._to_gcm, x, y)
+
+    def inv(self, x: int) -> int:
+        return self.base.tower_inv_mapped(self._to_tower, self._to_gcm, x)
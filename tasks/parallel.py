@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Process pool for parallel work inside a single factorization or crack.
+
+The pool is created on first use with the spawn start method and reused
+for the rest of the run. Work runs serially when only one worker is
+configured, in daemonic processes (the per test case pool workers of kauma
+may not have children) and inside this pool's own workers, so nested calls
+never start pools of their own.
+
+Set the number of workers with KAUMA_FACTOR_WORKERS (default: all cores).
+"""
+import atexit
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+WORKERS = int(os.environ.get("KAUMA_FACTOR_WORKERS", "0")) or os.cpu_count() or 1
+
+_executor = None
+_in_worker = False
+
+
+def _mark_worker():
+    global _in_worker
+    _in_worker = True
+
+
+def available() -> bool:
+    """Whether parallel_map may use worker processes from this process."""
+    return WORKERS > 1 and not _in_worker and not mp.current_process().daemon
+
+
+def parallel_map(func, items) -> list:
+    """
+    Apply func to every item, in the worker pool when available.
+
+    :param func: A picklable (module level) function of one argument.
+    :param items: The arguments; they and the results must be picklable.
+    :return: The results in the order of items.
+    """
+    items = list(items)
+    if len(items) < 2 or not available():
+        return [func(item) for item in items]
+    return list(_pool().map(func, items))
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=WORKERS, mp_context=mp.get_context("spawn"),
+                                        initializer=_mark_worker)
+        atexit.register(shutdown)
+    return _executor
+
+
+def shutdown():
+    """Stop the worker pool; it is started again on the next parallel_map."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Sorting of base64 encoded polynomials for gfpoly_sort.
+
+Polynom.gfpoly_sort orders by degree, then by the coefficients from the
+highest degree down, each compared as an integer in GCM semantic. The same
+order is the byte order of a single key: the coefficient count as a fixed
+width prefix followed by the coefficients, highest degree first, each as
+16 big-endian bytes. The key is built straight from the base64 input
+without creating Polynom objects.
+
+The sort runs in memory: kauma loads the whole JSON document and keeps all
+responses until the output is written, so spilling chunks to disk would
+not lower its peak memory.
+"""
+import base64
+
+from tasks.polynom_perf import BIT_REVERSE_BYTES
+
+
+def sort_key(coeffs: list) -> bytes:
+    """
+    Sort key of a polynomial given as base64 coefficients, lowest degree first.
+
+    Reversing the bits of every byte converts to GCM semantic; reversing the
+    whole little-endian buffer then puts the coefficients highest degree
+    first, each big-endian.
+
+    :param coeffs: The base64 encoded coefficients.
+    :return: The key; keys compare like (degree, coefficients from the top).
+    """
+    raw = b''.join(base64.b64decode(coeff).ljust(16, b'\x00') for coeff in coeffs)
+    return len(coeffs).to_bytes(8, 'big') + raw.translate(BIT_REVERSE_BYTES)[::-1]
+
+
+def _canonical(coeffs: list) -> list:
+    """The coefficients as gfpoly_sort outputs them: 16 bytes each, base64 encoded."""
+    if all(len(coeff) == 24 for coeff in coeffs):
+        return coeffs
+    return [base64.b64encode(base64.b64decode(coeff).ljust(16, b'\x00')).decode() for coeff in coeffs]
+
+
+def sort_b64_polys(polys) -> list:
+    """
+    Sort base64 encoded polynomials like Polynom.gfpoly_sort.
+
+    :param polys: An iterable of polynomials, each a list of base64 coefficients.
+    :return: The sorted polynomials; equal polynomials keep their input order.
+    """
+    return [_canonical(poly) for poly in sorted(polys, key=sort_key)]
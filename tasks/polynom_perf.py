@@ -1,78 +1,14 @@
 #!/usr/bin/env python3
 import base64
-from cffi import FFI
-
-ffi = FFI()
-
-ffi.cdef("""
-    void gf2_128_mul(
-        const uint64_t a[2],
-        const uint64_t b[2],
-        const uint64_t reduction[2],
-        uint64_t result[2]
-    );
-""")
-
-lib = ffi.verify(r"""
-    #include <stdint.h>
-    #include <string.h>
-
-    static inline void shift_left_128(uint64_t out[2]) {
-        uint64_t carry = out[0] >> 63;
-        out[0] <<= 1;
-        out[1] = (out[1] << 1) | carry;
-    }
-
-    static inline void shift_right_128(uint64_t out[2]) {
-        uint64_t carry = out[1] & 1;
-        out[1] >>= 1;
-        out[0] = (out[0] >> 1) | (carry << 63);
-    }
-
-    static inline void xor_128(uint64_t out[2], const uint64_t in[2]) {
-        out[0] ^= in[0];
-        out[1] ^= in[1];
-    }
-
-    static inline int get_lsb(const uint64_t x[2]) {
-        return (int)(x[0] & 1ULL);
-    }
-
-    static inline int overflow_bit(const uint64_t x[2]) {
-        return (x[1] & (1ULL << 63)) ? 1 : 0;
-    }
-
-    void gf2_128_mul(
-        const uint64_t a[2],
-        const uint64_t b[2],
-        const uint64_t reduction[2],
-        uint64_t result[2]
-    ) {
-        uint64_t A[2], B[2], P[2];
-        A[0] = a[0]; A[1] = a[1];
-        B[0] = b[0]; B[1] = b[1];
-        P[0] = 0;    P[1] = 0; 
-
-        while (B[0] != 0 || B[1] != 0) {
-            if (get_lsb(B)) {
-                xor_128(P, A);
-            }
-
-            int ovf = overflow_bit(A);
-            shift_left_128(A);
-            if (ovf) {
-                xor_128(A, reduction);
-            }
-
-            shift_right_128(B);
-        }
-
-        result[0] = P[0];
-        result[1] = P[1];
-    }
-""", extra_compile_args=["-O3", "-std=c99"])
+import functools
+import math
+import os
+from collections import OrderedDict
+from tasks.gf128 import kernel, pack as pack_coeffs, unpack as unpack_coeffs
 
 BIT_REVERSE_TABLE = [int('{:08b}'.format(i)[::-1], 2) for i in range(256)]
+# Translation table for bytes.translate, reverses the bits of every byte
+BIT_REVERSE_BYTES = bytes(BIT_REVERSE_TABLE)
 
 # Precompute the reduction polynomial parts to avoid repeated calls
 _IRR_POLY = base64.b64decode("hwAAAAAAAAAAAAAAAAAAAAE=")
@@ -80,9 +16,21 @@ REDUCTION_POLYNOMIAL = int.from_bytes(_IRR_POLY, byteorder='little')
 R_LO = REDUCTION_POLYNOMIAL & 0xFFFFFFFFFFFFFFFF
 R_HI = (REDUCTION_POLYNOMIAL >> 64) & 0xFFFFFFFFFFFFFFFF
 
+def gcm_sem(element: int) -> int:
+    """
+    Map an integer between GCM semantic and the field element representation.
+
+    Reverses the bits within each of the 16 little-endian bytes. The mapping
+    is its own inverse.
+
+    :param element: The integer to map.
+    :return: The mapped integer.
+    """
+    return int.from_bytes(element.to_bytes(16, 'little').translate(BIT_REVERSE_BYTES), 'little')
+
 def gf2mul_int(x: int, y: int, r_lo=R_LO, r_hi=R_HI) -> int:
     """
-    Multiply two 128-bit integers x and y in GF(2^128) using the C function.
+    Multiply two 128-bit integers x and y in GF(2^128) using the field kernel.
 
     :param x: A 128-bit integer (0 <= x < 2^128)
     :param y: A 128-bit integer (0 <= y < 2^128)
@@ -90,19 +38,314 @@ def gf2mul_int(x: int, y: int, r_lo=R_LO, r_hi=R_HI) -> int:
     :param r_hi: Upper 64 bits of the reduction polynomial (default: R_HI)
     :return: The product (x * y) mod the given reduction polynomial, as an int.
     """
-    x_lo = x & 0xFFFFFFFFFFFFFFFF
-    x_hi = (x >> 64) & 0xFFFFFFFFFFFFFFFF
-    y_lo = y & 0xFFFFFFFFFFFFFFFF
-    y_hi = (y >> 64) & 0xFFFFFFFFFFFFFFFF
+    return kernel.mul(x, y, r_lo | (r_hi << 64))
 
-    a_arr = ffi.new("uint64_t[2]", [x_lo, x_hi])
-    b_arr = ffi.new("uint64_t[2]", [y_lo, y_hi])
-    r_arr = ffi.new("uint64_t[2]", [r_lo, r_hi])
-    p_arr = ffi.new("uint64_t[2]", [0, 0])
+def gf2mul_vec(a: list, b: list) -> list:
+    """
+    Element-wise multiply two equally long lists of field elements.
 
-    lib.gf2_128_mul(a_arr, b_arr, r_arr, p_arr)
-    product = p_arr[0] | (p_arr[1] << 64)
-    return product
+    :param a: A list of 128-bit integers.
+    :param b: A list of 128-bit integers of the same length.
+    :return: [a[i] * b[i]] in GF(2^128).
+    """
+    if len(a) != len(b):
+        raise ValueError("Vectors must have the same length")
+    return unpack_coeffs(kernel.vec_mul(pack_coeffs(a), pack_coeffs(b), len(a)))
+
+def gf2mul_scalar(s: int, v: list) -> list:
+    """
+    Multiply every element of a list by the same field element.
+
+    :param s: The scalar as a 128-bit integer.
+    :param v: A list of 128-bit integers.
+    :return: [s * v[i]] in GF(2^128).
+    """
+    return unpack_coeffs(kernel.scalar_mul(s, pack_coeffs(v), len(v)))
+
+def gf2mul_dot(a: list, b: list) -> int:
+    """
+    Compute the dot product sum(a[i] * b[i]) in GF(2^128).
+
+    :param a: A list of 128-bit integers.
+    :param b: A list of 128-bit integers of the same length.
+    :return: The dot product as an int.
+    """
+    if len(a) != len(b):
+        raise ValueError("Vectors must have the same length")
+    return kernel.dot(pack_coeffs(a), pack_coeffs(b), len(a))
+
+def gf2inv_batch(values: list) -> list:
+    """
+    Invert many field elements with a single inversion (Montgomery's trick).
+
+    Costs one inversion and 3(k-1) multiplications for k elements.
+    Zero elements are returned as zero.
+
+    :param values: A list of 128-bit integers.
+    :return: The list of inverses.
+    """
+    return unpack_coeffs(kernel.batch_inv(pack_coeffs(values), len(values)))
+
+# Operands with at most this many coefficients are multiplied schoolbook.
+# Measured with benchmarks/bench_karatsuba.py; KAUMA_KARATSUBA_THRESHOLD overrides it.
+KARATSUBA_THRESHOLD = int(os.environ.get("KAUMA_KARATSUBA_THRESHOLD", "32"))
+
+def gf2poly_mul(a, na: int, b, nb: int) -> bytes:
+    """
+    Multiply two packed polynomials with Karatsuba above KARATSUBA_THRESHOLD.
+
+    :param a: Packed coefficients of the first factor, lowest degree first.
+    :param na: Number of coefficients in a.
+    :param b: Packed coefficients of the second factor.
+    :param nb: Number of coefficients in b.
+    :return: The na + nb - 1 packed coefficients of the product.
+    """
+    return _karatsuba(a, na, b, nb, KARATSUBA_THRESHOLD)
+
+def _karatsuba(a, na: int, b, nb: int, threshold: int) -> bytes:
+    """
+    Recursive Karatsuba on packed buffers.
+
+    Sums and shifts of whole halves are done as XOR and shifts of Python
+    integers over the packed bytes, so each recursion step costs a constant
+    number of interpreter operations.
+    """
+    if na < nb:
+        a, na, b, nb = b, nb, a, na
+    if nb <= threshold:
+        return kernel.poly_mul(a, na, b, nb)
+
+    out_len = 16 * (na + nb - 1)
+    if 2 * nb <= na:
+        # Unbalanced: multiply b by slices of a of its own length
+        result = 0
+        for i in range(0, na, nb):
+            n_slice = min(nb, na - i)
+            product = _karatsuba(a[16 * i:16 * (i + n_slice)], n_slice, b, nb, threshold)
+            result ^= int.from_bytes(product, 'little') << (128 * i)
+        return result.to_bytes(out_len, 'little')
+
+    # a = a0 + x^m a1, b = b0 + x^m b1 with m < nb <= na
+    m = na // 2
+    a0, a1 = a[:16 * m], a[16 * m:]
+    b0, b1 = b[:16 * m], b[16 * m:]
+    z0 = _karatsuba(a0, m, b0, m, threshold)
+    z2 = _karatsuba(a1, na - m, b1, nb - m, threshold)
+    a_sum = (int.from_bytes(a0, 'little') ^ int.from_bytes(a1, 'little')).to_bytes(16 * (na - m), 'little')
+    b_sum = (int.from_bytes(b0, 'little') ^ int.from_bytes(b1, 'little')).to_bytes(16 * max(m, nb - m), 'little')
+    z1 = _karatsuba(a_sum, na - m, b_sum, max(m, nb - m), threshold)
+
+    z0 = int.from_bytes(z0, 'little')
+    z2 = int.from_bytes(z2, 'little')
+    z1 = int.from_bytes(z1, 'little') ^ z0 ^ z2
+    result = z0 ^ (z1 << (128 * m)) ^ (z2 << (256 * m))
+    return result.to_bytes(out_len, 'little')
+
+# Largest modulus degree for which ModulusContext tabulates X^i mod f
+MODULUS_TABLE_MAX_DEGREE = 192
+
+# Division switches from long division to Newton iteration when both the
+# quotient and the divisor have at least this many coefficients
+NEWTON_DIVISION_THRESHOLD = 1024
+
+def gf2poly_inv_series(f: list, k: int) -> list:
+    """
+    Invert a polynomial as a power series modulo X^k by Newton iteration.
+
+    Each step doubles the precision n of g = f^-1 mod X^n. As f * g = 1 + X^n e,
+    the next n coefficients are -(g * e) mod X^n, which in characteristic 2 is
+    g * e, so only the upper half is computed.
+
+    :param f: Coefficients of f, lowest degree first, with f[0] != 0.
+    :param k: The precision.
+    :return: The k coefficients of f^-1 mod X^k.
+    """
+    g = pack_coeffs([kernel.inv(f[0])])
+    f_buf = pack_coeffs(f[:k])
+    n = 1
+    while n < k:
+        n2 = min(2 * n, k)
+        nf = min(len(f), n2)
+        e = gf2poly_mul(f_buf[:16 * nf], nf, g, n)[16 * n:16 * n2]
+        if len(e) < 16 * (n2 - n):
+            e += bytes(16 * (n2 - n) - len(e))
+        g += gf2poly_mul(g[:16 * (n2 - n)], n2 - n, e, n2 - n)[:16 * (n2 - n)]
+        n = n2
+    return unpack_coeffs(g)
+
+def gf2poly_divmod_newton(a: list, b: list, b_rev_inv: list = None) -> tuple:
+    """
+    Divide a by b with a reversed power series inverse in O(M(n)).
+
+    With rev(p) the coefficients of p in reverse order and k = len(a) - len(b) + 1,
+    rev(q) = rev(a) * rev(b)^-1 mod X^k and r = a - q * b.
+
+    :param a: Dividend coefficients, lowest degree first.
+    :param b: Divisor coefficients with a non-zero leading coefficient.
+    :param b_rev_inv: rev(b)^-1 mod X^j for some j >= k, if already known.
+    :return: (quotient, remainder) coefficient lists; the remainder has len(b) - 1 entries.
+    """
+    k = len(a) - len(b) + 1
+    if b_rev_inv is None or len(b_rev_inv) < k:
+        b_rev_inv = gf2poly_inv_series(b[::-1], k)
+    q_rev = gf2poly_mul(pack_coeffs(a[:-k - 1:-1]), k, pack_coeffs(b_rev_inv[:k]), k)[:16 * k]
+    quotient = unpack_coeffs(q_rev)[::-1]
+    nr = len(b) - 1
+    qb = gf2poly_mul(pack_coeffs(quotient), k, pack_coeffs(b), len(b))
+    remainder = int.from_bytes(pack_coeffs(a[:nr]), 'little') ^ int.from_bytes(qb[:16 * nr], 'little')
+    return quotient, unpack_coeffs(remainder.to_bytes(16 * nr, 'little'))
+
+def gf2poly_divmod_long(a: list, divisor_view, divisor_len: int, lead_inv: int) -> tuple:
+    """
+    Long division of a by a packed divisor.
+
+    The remainder is kept packed so that each step is a single scaled
+    subtract of the divisor over the affected window.
+
+    :param a: Dividend coefficients, lowest degree first, as a list or packed buffer;
+              at least divisor_len of them.
+    :param divisor_view: Kernel view on the packed divisor coefficients.
+    :param divisor_len: Number of divisor coefficients.
+    :param lead_inv: Inverse of the divisor's leading coefficient.
+    :return: (quotient, remainder) coefficient lists; the remainder is not stripped.
+    :raises ValueError: If the divisor's leading coefficient is zero.
+    """
+    work_buf = pack_coeffs(a) if isinstance(a, list) else bytearray(a)
+    work_view = kernel.view(work_buf)
+    work_len = len(work_buf) // 16
+    quotient_coeffs = [0] * (work_len - divisor_len + 1)
+
+    while work_len >= divisor_len:
+        lead = int.from_bytes(work_buf[16 * (work_len - 1):16 * work_len], 'little')
+        if lead == 0:
+            work_len -= 1
+            continue
+        if lead_inv == 0:
+            raise ValueError("Division by zero")
+
+        curr_quotient = kernel.mul(lead, lead_inv)
+        pos = work_len - divisor_len
+        quotient_coeffs[pos] = curr_quotient
+
+        # work[pos:pos+len(divisor)] ^= curr_quotient * divisor
+        kernel.scalar_mul_add(curr_quotient, divisor_view, work_view, pos, divisor_len)
+        # The leading coefficient cancels by construction
+        work_len -= 1
+
+    return quotient_coeffs, unpack_coeffs(work_buf[:16 * work_len])
+
+# Polynomials of at least this degree use the half-GCD in Polynom.gcd; below it the
+# matrix products cost more than the quotient steps they save (benchmarks/bench_gcd.py:
+# 0.97x at degree 3888, 1.08x at 4096, 1.66x at 8748)
+HALF_GCD_THRESHOLD = 4096
+# The half-GCD recursion switches to Euclid steps below this degree
+HALF_GCD_BASE_DEGREE = 64
+
+# Helpers for the half-GCD on normalized coefficient lists, [] is zero
+def _trim(coeffs: list) -> list:
+    while coeffs and coeffs[-1] == 0:
+        coeffs.pop()
+    return coeffs
+
+def _poly_add(a: list, b: list) -> list:
+    if len(a) < len(b):
+        a, b = b, a
+    total = [x ^ y for x, y in zip(a, b)]
+    if len(a) > len(b):
+        total.extend(a[len(b):])
+    return _trim(total)
+
+def _poly_mul(a: list, b: list) -> list:
+    if not a or not b:
+        return []
+    return unpack_coeffs(gf2poly_mul(pack_coeffs(a), len(a), pack_coeffs(b), len(b)))
+
+def _poly_divmod(a: list, b: list) -> tuple:
+    if len(a) < len(b):
+        return [], a
+    if min(len(a) - len(b) + 1, len(b)) >= NEWTON_DIVISION_THRESHOLD:
+        quotient, remainder = gf2poly_divmod_newton(a, b)
+    else:
+        quotient, remainder = gf2poly_divmod_long(a, kernel.view(pack_coeffs(b)), len(b), kernel.inv(b[-1]))
+    return _trim(quotient), _trim(remainder)
+
+_IDENTITY = ([1], [], [], [1])
+
+def _mat_mul(m: tuple, n: tuple) -> tuple:
+    """Product of two 2x2 polynomial matrices (m00, m01, m10, m11)."""
+    return (_poly_add(_poly_mul(m[0], n[0]), _poly_mul(m[1], n[2])),
+            _poly_add(_poly_mul(m[0], n[1]), _poly_mul(m[1], n[3])),
+            _poly_add(_poly_mul(m[2], n[0]), _poly_mul(m[3], n[2])),
+            _poly_add(_poly_mul(m[2], n[1]), _poly_mul(m[3], n[3])))
+
+def _mat_apply(m: tuple, a: list, b: list) -> tuple:
+    return (_poly_add(_poly_mul(m[0], a), _poly_mul(m[1], b)),
+            _poly_add(_poly_mul(m[2], a), _poly_mul(m[3], b)))
+
+def _euclid_step(m: tuple, q: list) -> tuple:
+    """[[0, 1], [1, q]] * m: the step (a, b) -> (b, a + q b), as -q = q here."""
+    return (m[2], m[3], _poly_add(m[0], _poly_mul(q, m[2])), _poly_add(m[1], _poly_mul(q, m[3])))
+
+def _half_gcd(a: list, b: list) -> tuple:
+    """
+    Half-GCD of a and b with deg(a) > deg(b).
+
+    Returns a unimodular matrix M, a product of Euclid steps, such that
+    (c, d) = M (a, b) are consecutive remainders with deg(c) >= ceil(deg(a)/2) > deg(d).
+    The top halves of a and b determine the first half of the quotient
+    sequence, so M is found by two recursive calls on about half the degree.
+    """
+    m = len(a) // 2
+    if len(b) - 1 < m:
+        return _IDENTITY
+    if len(a) - 1 < HALF_GCD_BASE_DEGREE:
+        # Classical Euclid until the remainder drops below degree m
+        matrix = _IDENTITY
+        while b and len(b) - 1 >= m:
+            q, r = _poly_divmod(a, b)
+            matrix = _euclid_step(matrix, q)
+            a, b = b, r
+        return matrix
+
+    matrix = _half_gcd(a[m:], b[m:])
+    a, b = _mat_apply(matrix, a, b)
+    if len(b) - 1 < m:
+        return matrix
+    q, r = _poly_divmod(a, b)
+    matrix = _euclid_step(matrix, q)
+    a, b = b, r
+    if len(b) - 1 < m:
+        return matrix
+    k = max(2 * m - (len(a) - 1), 0)
+    return _mat_mul(_half_gcd(a[k:], b[k:]), matrix)
+
+def gf2poly_gcd(a: list, b: list) -> tuple:
+    """
+    Extended GCD of two coefficient lists by the half-GCD.
+
+    Above HALF_GCD_THRESHOLD each round jumps over half of the remaining
+    degree with one half-GCD matrix, below it plain Euclid steps are used.
+
+    :param a: Coefficients, lowest degree first; [] is zero.
+    :param b: Coefficients, lowest degree first; [] is zero.
+    :return: (g, s, t) with s * a + t * b = g; g is not made monic.
+    """
+    a, b = _trim(list(a)), _trim(list(b))
+    matrix = _IDENTITY
+    if len(a) < len(b):
+        a, b = b, a
+        matrix = ([], [1], [1], [])
+    while b:
+        if len(b) - 1 >= HALF_GCD_THRESHOLD and len(a) > len(b):
+            step = _half_gcd(a, b)
+            a, b = _mat_apply(step, a, b)
+            matrix = _mat_mul(step, matrix)
+            if not b:
+                break
+        q, r = _poly_divmod(a, b)
+        matrix = _euclid_step(matrix, q)
+        a, b = b, r
+    return a, matrix[0], matrix[1]
 
 class FieldElement:
     """
@@ -130,9 +373,7 @@ class FieldElement:
         param element: The integer to map.
         return: The mapped integer.
         """
-        element = element.to_bytes(16, 'little') 
-        reversed_element = bytes(BIT_REVERSE_TABLE[b] for b in element)
-        return int.from_bytes(reversed_element, 'little')
+        return gcm_sem(element)
 
     def __mul__(self, other: 'FieldElement') -> 'FieldElement':
         """
@@ -160,24 +401,13 @@ class FieldElement:
         """
         Compute the multiplicative inverse of a FieldElement 'element' in GF(2^128).
 
-        Uses the Extended Euclidean Algorithm to find the inverse modulo the
-        reduction polynomial.
+        Runs the native Itoh-Tsujii addition chain, a^(2^128 - 2), in the
+        field kernel.
 
         :param element: The integer representation of the FieldElement to invert.
         :return: The inverse as a FieldElement.
         """
-        mod = self._REDUCTION_POLYNOMIAL
-        a = int(Element)
-        u, v = a, mod
-        g1, g2 = 1,0
-        while u!=1:
-            if u.bit_length()<v.bit_length():
-                u,v = v,u
-                g1, g2 = g2, g1
-            shift = u.bit_length()-v.bit_length()
-            u^=v<<shift
-            g1 ^=g2<<shift
-        return FieldElement(g1)
+        return FieldElement(kernel.inv(int(Element)))
 
     def __truediv__(self, other) -> 'FieldElement':
         """
@@ -191,25 +421,26 @@ class FieldElement:
             raise ValueError("Division by zero")
         return self * self.inv(other)
     
+    def square(self) -> 'FieldElement':
+        """
+        Square the FieldElement.
+
+        Squaring is GF(2)-linear, so the kernel only spreads the bits and reduces.
+
+        :return: The square as a FieldElement.
+        """
+        return FieldElement(kernel.sqr(self.element))
+
     def sqrt(self) -> 'FieldElement':
         """
-        Compute the square root of the FieldElement by exponentiation.
+        Compute the square root of the FieldElement.
 
-        Implemented as element^(2^(127)) in GF(2^128).
+        Equivalent to element^(2^127), computed in the kernel as
+        E + sqrt(x) * O, where E and O hold the even and odd bits of the element.
 
         :return: The square root as a FieldElement.
         """
-        base = self
-        result = FieldElement(1)
-        exponent = (1 << 127)
-        
-        # Take the FieldElement to the power of 2^127
-        while exponent:
-            if exponent & 1:
-                result *= base
-            base *= base
-            exponent >>= 1
-        return result   
+        return FieldElement(kernel.sqrt(self.element))
 
     def __int__(self):
         return self.element
@@ -218,25 +449,191 @@ class FieldElement:
         return f"FieldElement(0x{self.element:032x})"
 
 
+class PolynomMemo:
+    """
+    Bounded LRU memo for Polynom results with hit and miss counters.
+
+    Keys are the method name and its (hashable) arguments, so equal
+    polynomials share an entry regardless of object identity.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        :param maxsize: Maximum number of entries before the least recently used is dropped.
+        """
+        if maxsize < 1:
+            raise ValueError("Memo size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def lookup(self, key):
+        """Return the memoized result for key, or None (counted as a miss)."""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def store(self, key, result):
+        """Memoize result for key, evicting the least recently used entry if full."""
+        self._entries[key] = result
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Return the counters and the current fill."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+# Memo for Polynom.gcd, / and poly_powmod; disabled unless KAUMA_POLY_MEMO
+# gives a size or enable_memo is called
+POLY_MEMO = PolynomMemo(int(os.environ["KAUMA_POLY_MEMO"])) if os.environ.get("KAUMA_POLY_MEMO") else None
+
+def enable_memo(maxsize: int = 1024) -> PolynomMemo:
+    """
+    Memoize Polynom.gcd, / and poly_powmod in a fresh LRU memo.
+
+    :param maxsize: Maximum number of memoized results.
+    :return: The memo, to read its counters.
+    """
+    global POLY_MEMO
+    POLY_MEMO = PolynomMemo(maxsize)
+    return POLY_MEMO
+
+def disable_memo():
+    """Stop memoizing and drop the memo."""
+    global POLY_MEMO
+    POLY_MEMO = None
+
+def _memoized(method):
+    """Serve a Polynom method from POLY_MEMO when it is enabled."""
+    @functools.wraps(method)
+    def wrapper(*args):
+        memo = POLY_MEMO
+        if memo is None:
+            return method(*args)
+        key = (method.__name__,) + args
+        result = memo.lookup(key)
+        if result is None:
+            result = method(*args)
+            memo.store(key, result)
+        return result
+    return wrapper
+
+
+def _is_immutable(buf) -> bool:
+    """Whether a packed buffer can be shared: bytes or a read-only view of bytes."""
+    if isinstance(buf, memoryview):
+        return buf.readonly and isinstance(buf.obj, bytes)
+    return isinstance(buf, bytes)
+
+
 class Polynom:
     """
     Represents polynomials over GF(2^128).
 
     Each coefficient is a 128-bit integer (using FieldElement arithmetic).
     Methods for addition, multiplication, division, GCD, etc., are provided.
+
+    The coefficients are stored packed, 16 little-endian bytes each, in the
+    layout of the field kernel. The int list is a compatibility view that is
+    unpacked on first access; whichever form is missing is created lazily.
+
+    Polynoms are immutable: equal coefficient sequences compare equal and
+    hash alike, so results can be memoized and shared. The coefficients are
+    copied into a tuple or bytes on construction, .int returns a new list
+    and .packed an immutable buffer, so callers can not change them.
     """
 
-    def __init__(self, polynomials: list):
+    __slots__ = ('_int', '_packed', '_hash')
+
+    def __init__(self, polynomials):
         """
         Initialize a polynomial with a list of coefficients.
 
-        :param polynomials: A list of integers representing the polynomial's coefficients.
+        :param polynomials: A list of integers representing the polynomial's coefficients,
+                            or the coefficients packed as bytes, bytearray or memoryview
+                            (copied unless it is immutable).
+        """
+        if isinstance(polynomials, (bytes, bytearray, memoryview)):
+            self._int = None
+            self._packed = polynomials if _is_immutable(polynomials) else bytes(polynomials)
+        else:
+            self._int = tuple(polynomials)
+            self._packed = None
+        self._hash = None
+
+    @property
+    def int(self) -> list:
+        """The coefficients as a new list of integers, lowest degree first."""
+        if self._int is None:
+            self._int = tuple(unpack_coeffs(self._packed))
+        return list(self._int)
+
+    @property
+    def packed(self):
+        """The coefficients packed as 16 little-endian bytes each (bytes or a read-only memoryview)."""
+        if self._packed is None:
+            self._packed = bytes(pack_coeffs(self._int))
+        return self._packed
+
+    def _len(self) -> int:
+        """Number of coefficients, without unpacking."""
+        return len(self._int) if self._int is not None else len(self._packed) // 16
+
+    def _is_zero(self) -> bool:
+        """Whether this is the zero polynomial [0]."""
+        return self._len() == 1 and self[0] == 0
+
+    def _is_one(self) -> bool:
+        """Whether this is the constant polynomial [1]."""
+        return self._len() == 1 and self[0] == 1
+
+    def __getitem__(self, index):
+        """
+        A coefficient for an integer index; for a slice, a Polynom over
+        that range of coefficients sharing the packed storage.
         """
-        self.int = polynomials
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len())
+            if step != 1:
+                return Polynom(self.int[index])
+            return Polynom(memoryview(self.packed)[16 * start:16 * max(start, stop)])
+        if self._int is not None:
+            return self._int[index]
+        if index < 0:
+            index += self._len()
+        if not 0 <= index < self._len():
+            raise IndexError("Polynom index out of range")
+        return int.from_bytes(self._packed[16 * index:16 * index + 16], 'little')
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Polynom):
+            return NotImplemented
+        return self._len() == other._len() and self.packed == other.packed
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(bytes(self.packed))
+        return self._hash
+
+    def __reduce__(self):
+        # The packed storage may be a memoryview, which can not be pickled
+        return (Polynom, (bytes(self.packed),))
 
     def degree(self):
         """Return the degree of the polynomial."""
-        return len(self.int)-1
+        return self._len()-1
 
     def _normalize(self):
         """
@@ -244,9 +641,14 @@ class Polynom:
 
         :return: A normalized Polynom.
         """
-        while self.int and self.int[-1] == 0:
-            self.int.pop()
-        return Polynom(self.int)
+        return Polynom._from_packed(self.packed)
+
+    @staticmethod
+    def _from_packed(raw) -> 'Polynom':
+        """A Polynom over packed coefficients with trailing zero coefficients removed."""
+        raw = bytes(raw)
+        end = len(raw.rstrip(b'\x00'))
+        return Polynom(raw[:(end + 15) // 16 * 16])
 
     def __add__(self, other):
         """
@@ -255,54 +657,42 @@ class Polynom:
         :param other: Another Polynom.
         :return: The sum as a Polynom.
         """
-        if self.int == other.int:
+        a, b = self.packed, other.packed
+        if a == b:
             return Polynom([0])
         
-        if self.int == [0]:
+        if self._is_zero():
             return other
         
-        if other.int == [0]:
+        if other._is_zero():
             return self
         
-        max_len = max(len(self.int), len(other.int))
-        self_int = self.int + [0] * (max_len - len(self.int))
-        other_int = other.int + [0] * (max_len - len(other.int))
-        result_poly = [s ^ o for s, o in zip(self_int, other_int)]
-        
-        result = Polynom(result_poly)
-        result._normalize()
-        
-        return result    
+        max_len = max(len(a), len(b))
+        total = int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')
+        return Polynom._from_packed(total.to_bytes(max_len, 'little'))
 
     def __mul__(self, other):
         """
         Multiply two polynomials over GF(2^128).
 
-        Uses gf2mul_int for each coefficient multiplication and XOR for combination.
+        Karatsuba above KARATSUBA_THRESHOLD coefficients, below it a single
+        call into the schoolbook kernel with one reduction per coefficient.
 
         :param other: Another Polynom.
         :return: The product as a Polynom.
         """
-        if self.int == [0] or other.int == [0]:
+        # The empty polynomial, e.g. from a sum or derivative, is zero as well
+        if self._len() == 0 or other._len() == 0 or self._is_zero() or other._is_zero():
             return Polynom([0])
 
-        # Direct integer multiplication using gf2mul_int
-        result_poly = [0] * (len(self.int) + len(other.int) - 1)
-
-        for i, a in enumerate(self.int):
-            if a == 0:
-                continue
-            for j, b in enumerate(other.int):
-                if b == 0:
-                    continue
-                # Directly multiply ints in GF(2^128)
-                result_poly[i+j] ^= gf2mul_int(a, b)
-
-        return Polynom(result_poly)
+        return Polynom(gf2poly_mul(self.packed, self._len(), other.packed, other._len()))
 
     def __pow__(self, exponent) -> 'Polynom':
         """
-        Raise the polynomial to a given integer exponent (naive method).
+        Raise the polynomial to a given integer exponent.
+
+        Left-to-right square-and-multiply: one square per exponent bit and one
+        multiplication by the (small) base per set bit.
 
         :param exponent: The exponent.
         :return: self^exponent as a Polynom.
@@ -311,107 +701,137 @@ class Polynom:
             return Polynom([1])
         if exponent ==1:
             return self
-        
-        base = self
-        result = base
-        exponent -=1
-        while exponent:
-            result = result * base
-            exponent -=1
+
+        result = self
+        for bit in bin(exponent)[3:]:
+            result = result.square()
+            if bit == '1':
+                result = result * self
         return result
+
+    def square(self) -> 'Polynom':
+        """
+        Square the polynomial in O(n).
+
+        In characteristic 2 the cross terms cancel, so
+        (sum a_i X^i)^2 = sum a_i^2 X^(2i).
+
+        :return: self^2 as a Polynom.
+        """
+        n = self._len()
+        if n == 0:
+            return Polynom([])
+        out = bytearray(16 * (2 * n - 1))
+        # Interleave the squares with zero coefficients, two 64-bit words each
+        words = memoryview(out).cast('Q')
+        squares = memoryview(kernel.vec_sqr(self.packed, n)).cast('Q')
+        words[0::4] = squares[0::2]
+        words[1::4] = squares[1::2]
+        return Polynom(out)
      
+    @_memoized
     def __truediv__(self, divisor):
         """
         Divide one polynomial by another (with remainder).
 
-        Uses polynomial long division over GF(2^128).
+        Memoized when POLY_MEMO is enabled.
 
         :param divisor: The divisor Polynom.
         :return: (quotient, remainder) as (Polynom, Polynom).
         """
-        if len(divisor.int) == 0:
+        return self._divmod(divisor)
+
+    def _divmod(self, divisor):
+        """
+        Divide one polynomial by another (with remainder).
+
+        Long division with the divisor's leading coefficient inverted once.
+        When quotient and divisor both reach NEWTON_DIVISION_THRESHOLD
+        coefficients, divides via a Newton power series inverse instead.
+
+        :param divisor: The divisor Polynom.
+        :return: (quotient, remainder) as (Polynom, Polynom).
+        """
+        if divisor._len() == 0:
             return Polynom([0]), self
             
-        if len(self.int) == 0 or (len(self.int) == 1 and self.int[0] == 0):
+        if self._len() == 0 or self._is_zero():
             return (Polynom([0]), Polynom([0]))
         
-        remainder = Polynom(self.int.copy())
-        remainder.int = self.int.copy()
-        
         dividend_degree = self.degree()
         divisor_degree = divisor.degree()
         
         if dividend_degree < divisor_degree:
-            return Polynom([0]), remainder
+            return Polynom([0]), Polynom(bytes(self.packed))
         
-        quotient_coeffs = [0] * (dividend_degree - divisor_degree + 1)
-        
-        work_remainder = remainder.int.copy()
-        
-        while len(work_remainder) >= len(divisor.int):
-            if work_remainder and work_remainder[-1] == 0:
-                work_remainder.pop()
-                continue
-            
-            if not work_remainder:
-                break
-            
-            curr_remainder_degree = len(work_remainder) - 1
-            curr_divisor_degree = len(divisor.int) - 1
-            
-            lead_remainder = FieldElement(work_remainder[-1])
-            lead_divisor = FieldElement(divisor.int[-1])
-            curr_quotient = lead_remainder / lead_divisor
-            
-            pos = curr_remainder_degree - curr_divisor_degree
-            quotient_coeffs[pos] = int(curr_quotient)
-            
-            subtrahend_coeffs = [0]*pos
-            for coeff in divisor.int:
-                mult_result = int(FieldElement(coeff) * curr_quotient)
-                subtrahend_coeffs.append(mult_result)
-                
-            while len(subtrahend_coeffs) < len(work_remainder):
-                subtrahend_coeffs.insert(0, 0)
-                
-            for i in range(len(work_remainder)):
-                work_remainder[i] ^= subtrahend_coeffs[i]
-                
-            while work_remainder and work_remainder[-1] == 0:
-                work_remainder.pop()        
-        remainder = Polynom(work_remainder)
-        if remainder.int ==[]:
-            remainder = Polynom([0])
+        quotient_len = dividend_degree - divisor_degree + 1
+        divisor_len = divisor._len()
+        lead_divisor = divisor[-1]
+
+        if lead_divisor and min(quotient_len, divisor_len) >= NEWTON_DIVISION_THRESHOLD:
+            quotient_coeffs, work_remainder = gf2poly_divmod_newton(self.int, divisor.int)
+            return Polynom(quotient_coeffs), Polynom._from_remainder(work_remainder)
+
+        # The leading coefficient of the divisor is inverted once
+        divisor_view = kernel.view(divisor.packed)
+        quotient_coeffs, work_remainder = gf2poly_divmod_long(
+            self.packed, divisor_view, divisor_len, kernel.inv(lead_divisor))
         quotient = Polynom(quotient_coeffs)
-        return quotient, remainder
+        return quotient, Polynom._from_remainder(work_remainder)
+
+    def exact_div(self, divisor) -> 'Polynom':
+        """
+        Quotient of a division that is known to leave no remainder.
+
+        The k quotient coefficients only depend on the top k coefficients of
+        the dividend and of the divisor, so the division runs on those alone
+        and stops as soon as the quotient is known; the lower coefficients,
+        which only decide the (zero) remainder, are never read.
 
-    def poly_powmod(self, modulus: 'Polynom', exponent) -> 'Polynom':
+        :param divisor: A Polynom dividing self.
+        :return: self / divisor as a Polynom.
+        """
+        n, m = self._len(), divisor._len()
+        if n == 0 or self._is_zero() or n < m:
+            return Polynom([0])
+        k = n - m + 1
+        skip = max(0, m - k)
+        top = memoryview(self.packed)[16 * skip:]
+        divisor_top = memoryview(divisor.packed)[16 * skip:]
+        if divisor[-1] and min(k, m - skip) >= NEWTON_DIVISION_THRESHOLD:
+            quotient, _ = gf2poly_divmod_newton(unpack_coeffs(top), unpack_coeffs(divisor_top))
+        else:
+            quotient, _ = gf2poly_divmod_long(top, kernel.view(divisor_top), m - skip, kernel.inv(divisor[-1]))
+        return Polynom(quotient)
+
+    @staticmethod
+    def _from_remainder(coeffs: list) -> 'Polynom':
+        """Strip trailing zeros of a remainder; the zero remainder is [0]."""
+        while coeffs and coeffs[-1] == 0:
+            coeffs.pop()
+        return Polynom(coeffs if coeffs else [0])
+
+    @staticmethod
+    def _from_remainder_packed(raw) -> 'Polynom':
+        """_from_remainder for packed coefficients."""
+        remainder = Polynom._from_packed(raw)
+        return remainder if remainder._len() else Polynom([0])
+
+    @_memoized
+    def poly_powmod(self, modulus, exponent) -> 'Polynom':
         """
         Compute self^exponent mod modulus using fast exponentiation.
 
-        :param modulus: The modulus polynomial.
+        Memoized when POLY_MEMO is enabled.
+
+        :param modulus: The modulus polynomial, or a ModulusContext for it to
+                        reuse its precomputed reduction.
         :param exponent: The exponent (integer).
         :return: (self^exponent) mod modulus as a Polynom.
         """
-        if exponent == 0:
-            return Polynom([1])
-        
-        if exponent == 1:
-            result, remainder = self / modulus
-            return remainder
-            
-        result = Polynom([1])
-        base = self
-        _, base = base / modulus
-        
-        while exponent > 0:
-            if exponent & 1:
-                result *= base
-                _, result = result / modulus
-            base *= base
-            _, base = base / modulus
-            exponent >>= 1
-        return result
+        if not isinstance(modulus, ModulusContext):
+            modulus = ModulusContext(modulus)
+        return modulus.powmod(self, exponent)
 
     def gfpoly_sort(self, *others):
         """
@@ -421,28 +841,50 @@ class Polynom:
         :return: A sorted list of Polynom objects.
         """
         all_poly = [self] + list(others)
-        def compare_polys(poly):
-            key = [poly.degree()]
-            for item in poly.int[::-1]:
-                key.append(item)
-            return tuple(key)
-        sorted_polys = sorted(all_poly, key=compare_polys)
+        sorted_polys = sorted(all_poly, key=Polynom.sort_key)
         return sorted_polys
 
+    def sort_key(self) -> bytes:
+        """
+        Key ordering by degree, then by the coefficients from the highest degree down.
+
+        The packed little-endian coefficients reversed are the coefficients
+        highest first as big-endian integers, so a single bytes comparison
+        replaces a tuple of coefficients.
+        """
+        return self._len().to_bytes(8, 'big') + bytes(self.packed)[::-1]
+
     def gfpoly_makemonic(self) -> list:
         """
         Make the polynomial monic by dividing all coefficients by the leading coefficient.
 
         :return: A list of normalized coefficients.
         """
-        highest_coefficient = int(FieldElement(self.int[-1]))
-        new_poly = [0] * len(self.int)
-        
-        for i, coeff in enumerate(self.int):
-            res = int(FieldElement(coeff) / FieldElement(highest_coefficient))
-            new_poly[i] = res
-        
-        return [coeff for coeff in new_poly]
+        inverse = FieldElement(1) / FieldElement(self[-1])
+        return self.scale(int(inverse)).int
+
+    def scale(self, factor: int) -> 'Polynom':
+        """
+        Multiply every coefficient by the same field element.
+
+        :param factor: The scalar as a 128-bit integer.
+        :return: factor * self as a Polynom.
+        """
+        return Polynom(kernel.scalar_mul(factor, self.packed, self._len()))
+
+    @staticmethod
+    def make_monic_batch(polys: list) -> list:
+        """
+        Make many polynomials monic with a single field inversion.
+
+        The leading coefficients are inverted together with Montgomery's trick,
+        then each polynomial is scaled by its inverse.
+
+        :param polys: A list of Polynom objects with non-zero leading coefficients.
+        :return: A list of monic Polynom objects in the same order.
+        """
+        inverses = gf2inv_batch([poly[-1] for poly in polys])
+        return [poly if inverse == 1 else poly.scale(inverse) for poly, inverse in zip(polys, inverses)]
 
     def sqrt(self) -> 'Polynom':
         """
@@ -450,13 +892,14 @@ class Polynom:
 
         :return: A Polynom representing the square root.
         """
-        result = []
-        for degree, coeff in enumerate(self.int):
-            if (degree+1)%2:
-                coeff_fe = FieldElement(coeff)
-                sqrt_coeff = coeff_fe.sqrt()
-                result.append(sqrt_coeff.element)
-        return Polynom(result)
+        # Only the even-degree coefficients survive
+        n = (self._len() + 1) // 2
+        even = bytearray(16 * n)
+        words = memoryview(self.packed).cast('B').cast('Q')
+        even_words = memoryview(even).cast('Q')
+        even_words[0::2] = words[0::4]
+        even_words[1::2] = words[1::4]
+        return Polynom(kernel.vec_sqrt(even, n))
 
     def derivative(self) -> 'Polynom':
         """
@@ -474,33 +917,288 @@ class Polynom:
                 coeff = 0
             derivative.append(coeff)
         derivative.pop(0)
-        result_poly = Polynom(derivative)
-        result_poly._normalize()
-        return result_poly
+        return Polynom(derivative)._normalize()
 
+    @_memoized
     def gcd(self, other) -> 'Polynom':
         """
         Compute the greatest common divisor (GCD) of two polynomials.
 
+        Uses the half-GCD once both polynomials reach HALF_GCD_THRESHOLD,
+        plain Euclid below. Memoized when POLY_MEMO is enabled.
+
         :param other: Another Polynom.
         :return: The GCD as a Polynom.
         """
         f = self
         g = other
-        if len(other.int)>len(self.int):
+        if other._len()>self._len():
             f,g = g,f
-        if self.int[0] == [0]:
-            return other
-        if other.int[0] == [0]:
-            return self
-        while g.int != [0]:
-            q, r = f / g
+        # gcd(f, 0) is f made monic
+        if self._is_zero():
+            f, g = other, self
+        elif other._is_zero():
+            f, g = self, other
+        elif (min(f._len(), g._len()) - 1 >= HALF_GCD_THRESHOLD
+                and f[-1] != 0 and g[-1] != 0):
+            f = Polynom(gf2poly_gcd(f.int, g.int)[0])
+            g = Polynom([0])
+        while not g._is_zero():
+            # Intermediate remainders would only crowd the memo
+            q, r = f._divmod(g)
             f = g
             g = r
-        if f.int[-1] !=1:
+        if f[-1] !=1:
             f = Polynom(f.gfpoly_makemonic())
         return f
 
+    def gcd_ext(self, other) -> tuple:
+        """
+        Extended GCD with Bezout cofactors.
+
+        :param other: Another Polynom.
+        :return: (g, s, t) with s * self + t * other = g and g monic,
+                 or g = 0 if both are zero.
+        """
+        g, s, t = gf2poly_gcd(self.int, other.int)
+        if g:
+            lead_inv = kernel.inv(g[-1])
+            g, s, t = ([kernel.mul(c, lead_inv) for c in poly] for poly in (g, s, t))
+        return tuple(Polynom(poly if poly else [0]) for poly in (g, s, t))
+
     def __int__(self):
         return self.int
 
+
+class ModulusContext:
+    """
+    Precomputed reduction modulo a fixed polynomial f.
+
+    Holds the packed f and the inverse of its leading coefficient, and on
+    demand the Newton reciprocal of rev(f) and a table of X^i mod f for
+    deg(f) <= i <= 2 deg(f) - 2. With the table, reducing a product of two
+    reduced polynomials is a single linear combination of table rows.
+    Results match the remainder of Polynom.__truediv__.
+    """
+
+    def __init__(self, modulus: Polynom, table: bool = None):
+        """
+        :param modulus: The modulus polynomial f.
+        :param table: Whether to build the X^i mod f table; by default only
+                      for degrees up to MODULUS_TABLE_MAX_DEGREE.
+        """
+        self.modulus = modulus
+        self.n = modulus._len()
+        self.lead_inv = kernel.inv(modulus[-1]) if self.n else 0
+        self._buf = bytes(modulus.packed)
+        self._view = kernel.view(self._buf)
+        self._rev_inv = None
+        if table is None:
+            table = self.lead_inv != 0 and 2 <= self.n <= MODULUS_TABLE_MAX_DEGREE + 1
+        self._table = self._build_table() if table else None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ModulusContext):
+            return NotImplemented
+        return self.modulus == other.modulus
+
+    def __hash__(self) -> int:
+        # Contexts for the same modulus give the same results, e.g. as memo keys
+        return hash(self.modulus)
+
+    def _build_table(self) -> bytearray:
+        """Rows X^i mod f for i = d .. 2d-2, d = deg(f), each with d coefficients."""
+        d = self.n - 1
+        low = self._buf[:16 * d]
+        # X^d = -(f - lead X^d) / lead mod f
+        row = kernel.scalar_mul(self.lead_inv, low, d)
+        rows = [row]
+        for _ in range(d - 2):
+            top = int.from_bytes(row[16 * (d - 1):], 'little')
+            shifted = bytes(16) + row[:16 * (d - 1)]
+            if top:
+                correction = kernel.scalar_mul(kernel.mul(top, self.lead_inv), low, d)
+                row = (int.from_bytes(shifted, 'little') ^ int.from_bytes(correction, 'little')).to_bytes(16 * d, 'little')
+            else:
+                row = shifted
+            rows.append(row)
+        return bytearray(b''.join(rows))
+
+    def reciprocal(self) -> list:
+        """Return rev(f)^-1 mod X^deg(f), computed once by Newton iteration."""
+        if self._rev_inv is None:
+            self._rev_inv = gf2poly_inv_series(self.modulus.int[::-1], max(self.n - 1, 1))
+        return self._rev_inv
+
+    def reduce(self, coeffs) -> Polynom:
+        """
+        Reduce a polynomial modulo f.
+
+        :param coeffs: Coefficients, lowest degree first, as a list or packed buffer.
+        :return: coeffs mod f as a Polynom.
+        """
+        if isinstance(coeffs, list):
+            if self.n == 0:
+                return Polynom(coeffs)
+            coeffs = Polynom(coeffs)
+        else:
+            coeffs = Polynom(coeffs)
+            if self.n == 0:
+                return coeffs
+        length = coeffs._len()
+        if length == 0 or coeffs._is_zero():
+            return Polynom([0])
+        if length < self.n:
+            return coeffs
+
+        d = self.n - 1
+        buf = coeffs.packed
+        if self._table is not None and length <= 2 * d - 1:
+            combined = kernel.lincomb(buf[16 * d:], length - d, self._table, d)
+            low = int.from_bytes(buf[:16 * d], 'little') ^ int.from_bytes(combined, 'little')
+            return Polynom._from_remainder_packed(low.to_bytes(16 * d, 'little'))
+        if self.lead_inv and min(length - d, self.n) >= NEWTON_DIVISION_THRESHOLD:
+            _, remainder = gf2poly_divmod_newton(coeffs.int, self.modulus.int, self.reciprocal())
+            return Polynom._from_remainder(remainder)
+        _, remainder = gf2poly_divmod_long(buf, self._view, self.n, self.lead_inv)
+        return Polynom._from_remainder(remainder)
+
+    def mulmod(self, a: Polynom, b: Polynom) -> Polynom:
+        """Return a * b mod f."""
+        return self.reduce((a * b).packed)
+
+    def sqrmod(self, a: Polynom) -> Polynom:
+        """Return a^2 mod f via the O(n) squaring path."""
+        return self.reduce(a.square().packed)
+
+    def trace(self, h: Polynom, k: int) -> Polynom:
+        """
+        Return sum h^(2^i) for i < k mod f.
+
+        With the X^i mod f table the squarings stay on packed buffers of
+        deg(f) coefficients: one vec_sqr, spreading the squares to the even
+        positions, and one lincomb for the upper half.
+
+        :param h: The polynomial.
+        :param k: Number of terms, e.g. 128 * d for the trace to GF(2) over GF(2^(128 d)).
+        """
+        term = self.reduce(h.packed)
+        d = self.n - 1
+        if self._table is None or d < 2:
+            trace = self._packed_remainder(term)
+            for _ in range(k - 1):
+                term = self.sqrmod(term)
+                trace ^= self._packed_remainder(term)
+            return Polynom._from_remainder_packed(trace.to_bytes(16 * max(d, term._len()), 'little'))
+
+        buf = bytes(term.packed).ljust(16 * d, b'\x00')
+        trace = int.from_bytes(buf, 'little')
+        spread = bytearray(16 * (2 * d - 1))
+        words = memoryview(spread).cast('Q')
+        high = memoryview(spread)[16 * d:]
+        for _ in range(k - 1):
+            squares = memoryview(kernel.vec_sqr(buf, d)).cast('Q')
+            words[0::4] = squares[0::2]
+            words[1::4] = squares[1::2]
+            value = (int.from_bytes(spread[:16 * d], 'little')
+                     ^ int.from_bytes(kernel.lincomb(high, d - 1, self._table, d), 'little'))
+            buf = value.to_bytes(16 * d, 'little')
+            trace ^= value
+        return Polynom._from_remainder_packed(trace.to_bytes(16 * d, 'little'))
+
+    def trace_frobenius(self, h: Polynom, d: int, frobenius: list) -> Polynom:
+        """
+        Return sum h^(2^i) for i < 128 d mod f from Frobenius images.
+
+        With T_k = sum h^(q^j), j < k, where h is first replaced by its trace
+        over GF(2^128), T_(a+b) = T_a + T_b(X^(q^a)) holds modulo f because
+        the coefficients lie in GF(q). Combining the doublings
+        T_(2k) = T_k + T_k(X^(q^k)) by the bits of d needs one trace of 128
+        terms and about 2 log(d) modular compositions instead of 128 d
+        squarings.
+
+        :param h: The polynomial.
+        :param d: Number of Frobenius terms, the trace is to GF(2) over GF(2^(128 d)).
+        :param frobenius: X^(q^(2^i)) mod f for every i with 2^i < d.
+        """
+        block = self.trace(h, 128)
+        result = None
+        for i in range(d.bit_length()):
+            powers = None
+            if d >> i & 1:
+                if result is None:
+                    result = block
+                else:
+                    powers = self.composition_powers(frobenius[i])
+                    result = block + self.compose(result, powers)
+            if d >> (i + 1):
+                powers = powers or self.composition_powers(frobenius[i])
+                block = block + self.compose(block, powers)
+        return result
+
+    def powmod(self, base: Polynom, exponent) -> Polynom:
+        """
+        Return base^exponent mod f by right-to-left square-and-multiply.
+
+        :param base: The base polynomial.
+        :param exponent: The exponent (integer).
+        """
+        if exponent == 0:
+            return Polynom([1])
+        base = self.reduce(base.packed)
+        if exponent == 1:
+            return base
+
+        result = Polynom([1])
+        while exponent > 0:
+            if exponent & 1:
+                result = self.mulmod(result, base)
+            exponent >>= 1
+            if exponent:
+                base = self.sqrmod(base)
+        return result
+
+    def _packed_remainder(self, a: Polynom) -> int:
+        """A reduced polynomial as an integer over its deg(f) packed coefficients."""
+        return int.from_bytes(a.packed, 'little')
+
+    def composition_powers(self, h: Polynom) -> tuple:
+        """
+        Precompute the baby steps of Brent-Kung modular composition with h.
+
+        :param h: A polynomial reduced modulo f.
+        :return: (rows, m, h^m mod f) where rows packs h^0 .. h^(m-1) mod f,
+                 each padded to deg(f) coefficients, and m = isqrt(deg f) + 1.
+        """
+        d = self.n - 1
+        m = math.isqrt(d) + 1
+        rows = bytearray()
+        power = Polynom([1])
+        for _ in range(m):
+            rows += self._packed_remainder(power).to_bytes(16 * d, 'little')
+            power = self.mulmod(power, h)
+        return rows, m, power
+
+    def compose(self, g: Polynom, powers: tuple) -> Polynom:
+        """
+        Brent-Kung modular composition g(h) mod f.
+
+        g is split into blocks of m coefficients; every block is a linear
+        combination of the precomputed h^0 .. h^(m-1) (one kernel call), and
+        the blocks are combined by Horner's rule in h^m, so only about
+        deg(g) / m full multiplications modulo f are needed.
+
+        :param g: A polynomial of degree below deg(f).
+        :param powers: The result of composition_powers(h).
+        :return: g(h) mod f as a Polynom.
+        """
+        rows, m, h_m = powers
+        d = self.n - 1
+        result = None
+        for start in reversed(range(0, g._len(), m)):
+            block = g[start:start + m]
+            value = int.from_bytes(kernel.lincomb(block.packed, block._len(), rows, d), 'little')
+            if result is not None:
+                value ^= self._packed_remainder(self.mulmod(result, h_m))
+            result = Polynom._from_remainder_packed(value.to_bytes(16 * d, 'little'))
+        return result if result is not None else Polynom([0])
@@ -2,14 +2,25 @@
 import pstats
 import cProfile
 import base64
-from tasks.gfmul import gfmul
+import os
+from tasks.gfmul import gfmul, gfmul_gcm
 from tasks.poly import block2poly, poly2block, poly2block_gcm, block2poly_gcm
 from tasks.sea import sea_enc, sea_dec
 from tasks.xex import XEX
 from tasks.gcm import GCM_encrypt, GCM_decrypt
 from tasks.polynom import FieldElement, Polynom
-from tasks.gcm_pwn import sff, ddf, edf
-from kauma_conditional_mp import _base64_to_poly, poly_to_b64, handle_gcm_crack
+from tasks.gcm_pwn import sff, ddf, edf, roots, factor
+import tasks.gcm_pwn as gcm_pwn
+from tasks import parallel
+from tasks.polynom_perf import gf2mul_int, gf2mul_vec, gf2mul_scalar, gf2mul_dot
+from tasks.polynom_perf import FieldElement as FieldElementPerf, Polynom as PolynomPerf, gf2inv_batch, ModulusContext
+import tasks.polynom_perf as polynom_perf
+from tasks.gf128 import kernel, pack, unpack, _PythonKernel, MASK_128
+import tasks.field_array as field_array
+from tasks.field_array import FieldElementArray
+from tasks.gf128_tower import TowerKernel, TAU, SIGMA
+from tasks.poly_sort import sort_b64_polys
+from kauma_conditional_mp import _base64_to_poly, poly_to_b64, handle_gcm_crack, handle_gfpoly_makemonic, handle_gfpoly_add, ARRAY_MIN_LEN
 def test_gfmul() -> None:
     element_1 = "ARIAAAAAAAAAAAAAAAAAgA=="
     element_2 = "AgAAAAAAAAAAAAAAAAAAAA=="
@@ -391,6 +402,402 @@ def test_gfpoly_gcd():
     assert res == result
     print(f"GCD successful, result is: {res}\n")
 
+def test_gf2mul_batched():
+    a = [0x87, (1 << 127) | 1, 0xDEADBEEFCAFEBABE0123456789ABCDEF, 0]
+    b = [1 << 121, 0x2, 0xFEDCBA98765432100F1E2D3C4B5A6978, 0x1234]
+    expected = [gf2mul_int(x, y) for x, y in zip(a, b)]
+    assert gf2mul_vec(a, b) == expected
+    assert gf2mul_scalar(b[2], a) == [gf2mul_int(b[2], x) for x in a]
+    dot = 0
+    for value in expected:
+        dot ^= value
+    assert gf2mul_dot(a, b) == dot
+    print(f"Batched gfmul successful, result is: {expected}\n")
+
+def test_gf128_fallback_kernel():
+    fallback = _PythonKernel()
+    a = [0x87, (1 << 127) | 1, 0xDEADBEEFCAFEBABE0123456789ABCDEF]
+    b = [1 << 121, 0x2, 0xFEDCBA98765432100F1E2D3C4B5A6978]
+    assert fallback.mul(a[2], b[2]) == kernel.mul(a[2], b[2])
+    assert fallback.vec_mul(pack(a), pack(b), 3) == kernel.vec_mul(pack(a), pack(b), 3)
+    assert fallback.dot(pack(a), pack(b), 3) == kernel.dot(pack(a), pack(b), 3)
+    native_acc = pack([1, 2, 3, 4])
+    fallback_acc = pack([1, 2, 3, 4])
+    kernel.scalar_mul_add(b[2], kernel.view(pack(a)), kernel.view(native_acc), 1, 3)
+    fallback.scalar_mul_add(b[2], pack(a), fallback_acc, 1, 3)
+    assert unpack(native_acc) == unpack(fallback_acc)
+    print(f"Fallback kernel matches, result is: {unpack(fallback_acc)}\n")
+
+def test_field_inversion():
+    fallback = _PythonKernel()
+    for value in [1, 2, 0x87, (1 << 127) | 1, 0xDEADBEEFCAFEBABE0123456789ABCDEF]:
+        inverse = FieldElementPerf(0).inv(value)
+        assert int(inverse) == fallback.inv(value)
+        assert gf2mul_int(value, int(inverse)) == 1
+    quotient = FieldElementPerf(0x1234) / FieldElementPerf(0x87)
+    assert gf2mul_int(int(quotient), 0x87) == 0x1234
+    print(f"Field inversion successful, result is: {quotient}\n")
+
+def test_batch_inversion():
+    values = [0x87, 0, (1 << 127) | 1, 0xDEADBEEFCAFEBABE0123456789ABCDEF]
+    inverses = gf2inv_batch(values)
+    assert inverses == [int(FieldElementPerf(0).inv(value)) for value in values]
+    polys = [PolynomPerf([3, 5, 0x87]), PolynomPerf([1, 1]), PolynomPerf([7, 1 << 100])]
+    monic = PolynomPerf.make_monic_batch(polys)
+    assert [p.int for p in monic] == [p.gfpoly_makemonic() for p in polys]
+    assert all(p.int[-1] == 1 for p in monic)
+    print(f"Batch inversion successful, result is: {inverses}\n")
+
+def test_field_square_sqrt():
+    for value in [0, 1, 2, 0x87, (1 << 127) | 1, 0xDEADBEEFCAFEBABE0123456789ABCDEF]:
+        element = FieldElementPerf(value)
+        assert int(element.square()) == gf2mul_int(value, value)
+        root = element.sqrt()
+        assert int(root.square()) == value
+    print(f"Field square and sqrt successful, result is: {root}\n")
+
+def test_gfmul_gcm():
+    a = "ARIAAAAAAAAAAAAAAAAAgA=="
+    b = "AgAAAAAAAAAAAAAAAAAAAA=="
+    x = FieldElement(0)
+    a_fe = FieldElementPerf(x.gcm_sem(int.from_bytes(base64.b64decode(a), 'little')))
+    b_fe = FieldElementPerf(x.gcm_sem(int.from_bytes(base64.b64decode(b), 'little')))
+    expected = base64.b64encode(x.gcm_sem((a_fe * b_fe).element).to_bytes(16, 'little')).decode()
+    res = gfmul_gcm(a, b)
+    assert res == expected
+    print(f"GCM gfmul successful, result is: {res}\n")
+
+def test_field_element_array():
+    a = [0x1, 0x87, 0xDEADBEEF << 64, (1 << 127) | 0x42]
+    b = [0x2, 0x3, 0x5]
+    blocks = poly_to_b64(a)
+    have_numpy = field_array.HAVE_NUMPY
+    try:
+        # Exercise the NumPy layout and the bytearray fallback alike
+        for use_numpy in {have_numpy, False}:
+            field_array.HAVE_NUMPY = use_numpy
+            x = FieldElementArray.from_ints(a)
+            y = FieldElementArray.from_ints(b)
+            assert (x + y).to_ints() == [2 ^ 1, 3 ^ 0x87, 5 ^ (0xDEADBEEF << 64), a[3]]
+            assert (x * 0x87).to_ints() == [gf2mul_int(0x87, v) for v in a]
+            assert (x[:3] * y).to_ints() == [gf2mul_int(u, v) for u, v in zip(a, b)]
+            assert x.square().sqrt() == x
+            assert FieldElementArray.from_b64(blocks).to_ints() == a
+            assert FieldElementArray.from_b64(blocks).to_b64() == blocks
+            assert FieldElementArray.from_ints([1, 2, 0, 0]).trim().to_ints() == [1, 2]
+            assert x.find(0x87) == 1 and x.find(0x88) == -1
+    finally:
+        field_array.HAVE_NUMPY = have_numpy
+    print("FieldElementArray successful\n")
+
+def test_tower_field():
+    base = kernel.base if isinstance(kernel, TowerKernel) else kernel
+    # TAU is a root of t^64 + t^4 + t^3 + t + 1, SIGMA of y^2 + y + TAU^63
+    tau_pow = [1]
+    for _ in range(64):
+        tau_pow.append(base.mul(tau_pow[-1], TAU))
+    assert tau_pow[64] ^ tau_pow[4] ^ tau_pow[3] ^ tau_pow[1] ^ 1 == 0
+    assert base.mul(SIGMA, SIGMA) ^ SIGMA ^ tau_pow[63] == 0
+    for candidate in (base, _PythonKernel()):
+        tower = TowerKernel(candidate)
+        for x, y in [(0x2, 0x87), (1 << 127, 0xDEADBEEF << 64 | 0x1234), (MASK_128, 0x3)]:
+            assert tower.from_tower(tower.to_tower(x)) == x
+            assert tower.mul(x, y) == gf2mul_int(x, y)
+            assert gf2mul_int(tower.inv(x), x) == 1
+        assert tower.inv(0) == 0
+    print("Tower field backend successful\n")
+
+def test_karatsuba_mul():
+    a = [(i * 0x9E3779B97F4A7C15) ^ (i << 100) for i in range(1, 70)]
+    b = [(i * 0xC2B2AE3D27D4EB4F) ^ (i << 90) for i in range(1, 45)]
+    expected = unpack(kernel.poly_mul(pack(a), len(a), pack(b), len(b)))
+    threshold = polynom_perf.KARATSUBA_THRESHOLD
+    try:
+        for value in (1, 4, 16):
+            polynom_perf.KARATSUBA_THRESHOLD = value
+            assert (PolynomPerf(a) * PolynomPerf(b)).int == expected
+            assert (PolynomPerf(b[:5]) * PolynomPerf(a)).int == unpack(kernel.poly_mul(pack(b[:5]), 5, pack(a), len(a)))
+    finally:
+        polynom_perf.KARATSUBA_THRESHOLD = threshold
+    # A fixed default, so every process and pool worker splits at the same size
+    assert os.environ.get("KAUMA_KARATSUBA_THRESHOLD") or polynom_perf.KARATSUBA_THRESHOLD == 32
+    print("Karatsuba multiplication successful\n")
+
+def test_poly_square_pow():
+    p = PolynomPerf([0x2, 0x87, 1 << 127, 0x1])
+    assert p.square().int == (p * p).int
+    expected = p
+    for _ in range(12):
+        expected = expected * p
+    assert (p ** 13).int == expected.int
+    assert (p ** 0).int == [1]
+    modulus = PolynomPerf([0x3, 0x5, 0x7, 0x1, 0x1])
+    _, expected_mod = expected / modulus
+    assert p.poly_powmod(modulus, 13).int == expected_mod.int
+    print("Polynomial square and pow successful\n")
+
+def test_poly_division_newton():
+    a = PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 77) for i in range(1, 90)])
+    b = PolynomPerf([(i * 0xC2B2AE3D27D4EB4F) ^ (i << 99) for i in range(1, 40)])
+    threshold = polynom_perf.NEWTON_DIVISION_THRESHOLD
+    try:
+        polynom_perf.NEWTON_DIVISION_THRESHOLD = 1 << 30
+        expected_q, expected_r = a / b
+        polynom_perf.NEWTON_DIVISION_THRESHOLD = 8
+        q, r = a / b
+        assert q.int == expected_q.int and r.int == expected_r.int
+        q, r = (a * b) / b
+        assert q.int == a.int and r.int == [0]
+    finally:
+        polynom_perf.NEWTON_DIVISION_THRESHOLD = threshold
+    print("Newton division successful\n")
+
+def test_modulus_context():
+    f = PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 64) for i in range(1, 12)])
+    a = PolynomPerf([(i * 0xC2B2AE3D27D4EB4F) ^ (i << 99) for i in range(1, 15)])
+    _, a_mod = a / f
+    for table in (True, False):
+        context = ModulusContext(f, table=table)
+        assert context.reduce(a.int).int == a_mod.int
+        assert context.mulmod(a_mod, a_mod).int == ((a_mod * a_mod) / f)[1].int
+        assert context.sqrmod(a_mod).int == context.mulmod(a_mod, a_mod).int
+        assert a.poly_powmod(context, 1000).int == a.poly_powmod(f, 1000).int
+        term, trace = a_mod, a_mod
+        for _ in range(4):
+            term = context.sqrmod(term)
+            trace = trace + term
+        assert context.trace(a, 5).int == trace.int
+    print("Modulus context successful\n")
+
+def test_ddf_incremental():
+    linear = PolynomPerf([1, 1]) * PolynomPerf([2, 1]) * PolynomPerf([3, 1]) * PolynomPerf([5, 1])
+    assert ddf(linear) == [{"factor": linear.int, "degree": 1}]
+    # X^2 + X + 1 splits into linear factors, GF(4) is a subfield of GF(2^128)
+    quadratic = PolynomPerf([1, 1, 1])
+    assert ddf(quadratic * PolynomPerf([7, 1])) == [{"factor": (quadratic * PolynomPerf([7, 1])).int, "degree": 1}]
+    print("Incremental DDF successful\n")
+
+def test_ddf_bsgs():
+    f = PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 70) for i in range(1, 25)] + [1])
+    assert ddf(f, algorithm="bsgs") == ddf(f, algorithm="classic")
+    # Modular composition against Horner evaluation
+    context = ModulusContext(f)
+    h = context.reduce([0, 0, 0, 5, 7])
+    g = PolynomPerf([3, 1, 4, 1, 5, 9, 2, 6])
+    expected = PolynomPerf([0])
+    for coeff in reversed(g.int):
+        expected = context.reduce((context.mulmod(expected, h) + PolynomPerf([coeff])).int)
+    assert context.compose(g, context.composition_powers(h)).int == expected.int
+    print("Baby-step/giant-step DDF successful\n")
+
+def test_half_gcd():
+    common = PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 80) for i in range(1, 20)] + [1])
+    a = PolynomPerf([(i * 0xC2B2AE3D27D4EB4F) ^ (i << 99) for i in range(1, 90)] + [1]) * common
+    b = PolynomPerf([(i * 0x165667B19E3779F9) ^ (i << 64) for i in range(1, 70)] + [1]) * common
+    expected = a.gcd(b)
+    threshold, base = polynom_perf.HALF_GCD_THRESHOLD, polynom_perf.HALF_GCD_BASE_DEGREE
+    try:
+        polynom_perf.HALF_GCD_THRESHOLD, polynom_perf.HALF_GCD_BASE_DEGREE = 8, 4
+        assert a.gcd(b).int == expected.int == common.int
+        g, s, t = a.gcd_ext(b)
+        assert g.int == expected.int
+        assert (s * a + t * b).int == g.int
+    finally:
+        polynom_perf.HALF_GCD_THRESHOLD, polynom_perf.HALF_GCD_BASE_DEGREE = threshold, base
+    g, s, t = PolynomPerf([0]).gcd_ext(b)
+    assert g.int == b.gfpoly_makemonic() and (t * b).int == g.int
+    print("Half-GCD successful\n")
+
+def test_polynom_packed():
+    coeffs = [(i * 0x9E3779B97F4A7C15) ^ (i << 90) for i in range(1, 12)]
+    p = PolynomPerf(pack(coeffs))
+    assert p.int == coeffs and p[3] == coeffs[3] and p[-1] == coeffs[-1]
+    window = p[2:7]
+    assert window.int == coeffs[2:7]
+    assert isinstance(window.packed, memoryview)
+    assert PolynomPerf(coeffs).packed == p.packed
+    q = PolynomPerf(coeffs[:5])
+    assert (p + q).int == [a ^ b for a, b in zip(coeffs, coeffs[:5] + [0] * 6)]
+    assert (p + p).int == [0]
+    assert p.square().int == (p * p).int
+    assert p.square().sqrt().int == p.int
+    assert (window * q).int == (PolynomPerf(coeffs[2:7]) * q).int
+    print("Packed Polynom successful\n")
+
+def test_polynom_memo():
+    a = PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 90) for i in range(1, 12)])
+    b = PolynomPerf([(i * 0xC2B2AE3D27D4EB4F) ^ (i << 70) for i in range(1, 7)])
+    assert a == PolynomPerf(list(a.int)) and hash(a) == hash(PolynomPerf(pack(a.int)))
+    assert a != b and len({a, PolynomPerf(a.int), b}) == 2
+    try:
+        a.int = [1]
+        assert False, "Polynom must be immutable"
+    except AttributeError:
+        pass
+    # The coefficients are copied in and out, so mutating a caller's buffer can not change a Polynom
+    coeffs, buf = list(a.int), bytearray(pack(a.int))
+    copies = (PolynomPerf(coeffs), PolynomPerf(buf), PolynomPerf(memoryview(buf)))
+    coeffs[0] ^= 1
+    buf[0] ^= 1
+    a.int[0] ^= 1
+    assert all(copy == a and hash(copy) == hash(a) for copy in copies)
+    assert memoryview(a.packed).readonly and memoryview(a[2:5].packed).readonly
+    monic_b = PolynomPerf(b.gfpoly_makemonic())
+    assert PolynomPerf([0]).gcd(b) == b.gcd(PolynomPerf([0])) == monic_b
+    assert PolynomPerf([1])._is_one() and not monic_b._is_one() and not PolynomPerf([1, 0])._is_one()
+    expected = (a / b, a.gcd(b), a.poly_powmod(b, 12345))
+    memo = polynom_perf.enable_memo(2)
+    try:
+        for _ in range(2):
+            q, r = PolynomPerf(list(a.int)) / PolynomPerf(list(b.int))
+            assert (q, r) == expected[0]
+        assert memo.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 2}
+        assert a.gcd(b) == expected[1] and a.poly_powmod(ModulusContext(b), 12345) == expected[2]
+        assert a.poly_powmod(ModulusContext(b), 12345) == expected[2]
+        assert memo.hits == 2 and memo.stats()["size"] == 2
+    finally:
+        polynom_perf.disable_memo()
+    print("Polynom memo successful\n")
+
+def test_poly_sort_keys():
+    polys = [
+        ["NeverGonnaGiveYouUpAAA==", "NeverGonnaLetYouDownAA==", "NeverGonnaRunAroundAAA==", "AndDesertYouAAAAAAAAAA=="],
+        ["WereNoStrangersToLoveA==", "YouKnowTheRulesAAAAAAA==", "AndSoDoIAAAAAAAAAAAAAA=="],
+        ["NeverGonnaMakeYouCryAA==", "NeverGonnaSayGoodbyeAA==", "NeverGonnaTellALieAAAA==", "AndHurtYouAAAAAAAAAAAA=="],
+        ["AAAAAAAAAAAAAAAAAAAAAA=="],
+        ["WereNoStrangersToLoveA==", "YouKnowTheRulesAAAAAAA==", "AndSoDoIAAAAAAAAAAAAAA=="],
+        ["gAAAAAAAAAAAAAAAAAAAAA==", "AQAAAAAAAAAAAAAAAAAAAA=="],
+        ["AQAAAAAAAAAAAAAAAAAAAA==", "gAAAAAAAAAAAAAAAAAAAAA=="],
+    ]
+    decoded = [_base64_to_poly(poly) for poly in polys]
+    expected = [poly_to_b64(poly.int) for poly in decoded[0].gfpoly_sort(*decoded[1:])]
+    by_tuple = sorted(decoded, key=lambda poly: tuple([poly.degree()] + poly.int[::-1]))
+    assert expected == [poly_to_b64(poly.int) for poly in by_tuple]
+    assert sort_b64_polys(polys) == expected
+    assert sort_b64_polys(iter(polys)) == expected
+    print("Polynomial sort keys successful\n")
+
+def test_roots():
+    expected = [(i * 0x9E3779B97F4A7C15) ^ (i << 100) for i in range(1, 9)]
+    f = PolynomPerf([1])
+    for root in expected:
+        f = f * PolynomPerf([root, 1])
+    # A repeated root and an irreducible quadratic (X^2 + X + x^127 has no root)
+    f = f * PolynomPerf([expected[0], 1]) * PolynomPerf([1 << 127, 1, 1])
+    assert roots(f.scale(5)) == sorted(expected)
+    assert roots(PolynomPerf([7])) == []
+    assert roots(PolynomPerf([3, 1])) == [3]
+    print("Roots successful\n")
+
+def test_edf_splitters():
+    factors = [PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 100), 1]) for i in range(1, 7)]
+    f = PolynomPerf([1])
+    for factor in factors:
+        f = f * factor
+    expected = [factor.int for factor in factors[0].gfpoly_sort(*factors[1:])]
+    for splitter in ("trace", "power"):
+        assert [poly.int for poly in edf(f, 1, splitter=splitter)] == expected
+    quadratics = PolynomPerf([1 << 127, 1, 1]) * PolynomPerf([(1 << 127) | 1, 1, 1])
+    assert [poly.int for poly in edf(quadratics, 2)] == [poly.int for poly in edf(quadratics, 2, splitter="power")]
+    print("EDF splitters successful\n")
+
+def test_parallel_factorization():
+    factors = [PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 100), 1]) for i in range(1, 9)]
+    f = PolynomPerf([1])
+    for linear in factors:
+        f = f * linear
+    # Square-free factors of exponents 1 and 2 for the factor() batch
+    g = f * PolynomPerf([(i * 0xC2B2AE3D27D4EB4F) ^ (i << 70) for i in range(1, 12)] + [1]) ** 2
+    expected_edf = [poly.int for poly in edf(f, 1)]
+    expected_factor = factor(g)
+    workers, min_degree = parallel.WORKERS, gcm_pwn.PARALLEL_MIN_DEGREE
+    try:
+        parallel.WORKERS, gcm_pwn.PARALLEL_MIN_DEGREE = 2, 4
+        assert [poly.int for poly in edf(f, 1)] == expected_edf
+        assert factor(g) == expected_factor
+    finally:
+        parallel.WORKERS, gcm_pwn.PARALLEL_MIN_DEGREE = workers, min_degree
+        parallel.shutdown()
+    print("Parallel factorization successful\n")
+
+def test_sff_yun():
+    a = [PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 100), i, 1]) for i in range(1, 7)]
+    f = PolynomPerf([1])
+    for exponent, factor in enumerate(a, 1):
+        f = f * factor ** exponent
+    expected = sff(f, algorithm="classic")
+    assert sff(f) == expected
+    assert sorted((entry["exponent"], entry["factor"]) for entry in expected) == [(e, a[e - 1].int) for e in range(1, 7)]
+    assert sff(a[0] ** 4) == [{"factor": a[0].int, "exponent": 4}]
+    assert sff(PolynomPerf([1])) == []
+    assert (f * a[2]).exact_div(a[2]).int == f.int
+    assert f.exact_div(a[5] ** 6).int == (f / a[5] ** 6)[0].int
+    print("Yun SFF successful\n")
+
+def test_factor_pipeline():
+    linear = [PolynomPerf([(i * 0x9E3779B97F4A7C15) ^ (i << 100), 1]) for i in range(1, 4)]
+    quadratics = [PolynomPerf([1 << 127, 1, 1]), PolynomPerf([(1 << 127) | 1, 1, 1])]
+    f = linear[0] ** 3 * linear[1] * linear[2] * quadratics[0] ** 2 * quadratics[1] ** 2
+    expected = sorted([(linear[0].int, 3), (linear[1].int, 1), (linear[2].int, 1),
+                       (quadratics[0].int, 2), (quadratics[1].int, 2)])
+    assert sorted((item["factor"], item["exponent"]) for item in factor(f.scale(9))) == expected
+    assert factor(PolynomPerf([7])) == []
+
+    # The trace from Frobenius images of ddf equals the one from squarings
+    g = quadratics[0] * quadratics[1] * PolynomPerf([3, 5, 7, 1])
+    frobenius = []
+    ddf(g, frobenius=frobenius, algorithm="classic")
+    context = ModulusContext(g)
+    x_q = context.reduce([0, 1])
+    for _ in range(128):
+        x_q = context.sqrmod(x_q)
+    assert frobenius[0] == x_q
+    h = PolynomPerf([11, 13, 17, 19, 23, 29])
+    powers = gcm_pwn._frobenius_powers(context, frobenius, 3)
+    assert context.trace_frobenius(h, 3, powers) == context.trace(h, 3 * 128)
+    assert sorted(poly.int for poly in edf(quadratics[0] * quadratics[1], 2, frobenius=frobenius)) == sorted(q.int for q in quadratics)
+    print("Factor pipeline successful\n")
+
+def test_kernel_build_hash():
+    import tasks.gf128 as gf128
+    from tasks import gf128_build
+    # A stale in-tree build must never be loaded in place of the current sources
+    if gf128.NATIVE:
+        assert gf128.ffi.string(gf128.lib.gf2_128_build_hash()).decode() == gf128_build.source_hash()
+    print("Kernel build hash successful\n")
+
+def test_empty_polynom_mul():
+    # Empty coefficient lists come from sums and derivatives and must not reach the kernel
+    empty = PolynomPerf([1, 0]) + PolynomPerf([1])
+    assert empty._len() == 0
+    assert (empty * PolynomPerf([3, 4])).int == [0]
+    assert (PolynomPerf([3, 4]) * empty).int == [0]
+    assert (PolynomPerf([1, 0, 1]).derivative() * PolynomPerf([5])).int == [0]
+    assert kernel.poly_mul(b'', 0, pack([1]), 1) == bytearray()
+    assert _PythonKernel().poly_mul(pack([1]), 1, b'', 0) == bytearray()
+    print("Empty polynom multiplication successful\n")
+
+def test_makemonic_zero_leading():
+    # The FieldElementArray path for long inputs raises like the Polynom path
+    for length in (3, ARRAY_MIN_LEN + 7):
+        coeffs = poly_to_b64([5] * (length - 1) + [0])
+        try:
+            handle_gfpoly_makemonic({"A": coeffs})
+            assert False, "expected ValueError"
+        except ValueError as e:
+            assert str(e) == "Division by zero"
+    print("Make monic with zero leading coefficient successful\n")
+
+def test_gfpoly_add_paths():
+    # The FieldElementArray path for long inputs normalizes like Polynom.__add__
+    for n in (3, ARRAY_MIN_LEN + 5):
+        zero, short = poly_to_b64([0]), poly_to_b64([9, 0, 0])
+        x, y = poly_to_b64([5] * n + [0, 0]), poly_to_b64([7] * (n - 1) + [5, 0])
+        for a, b in ((zero, x), (x, zero), (x, y), (x, x), (y, short), (short, y), (zero, zero)):
+            expected = poly_to_b64((_base64_to_poly(a) + _base64_to_poly(b)).int)
+            assert handle_gfpoly_add({"A": a, "B": b})["S"] == expected
+    print("Polynomial addition paths successful\n")
+
 def test_gfpoly_factor_sff():
     f = Polynom([
     "vL77UwAAAAAAAAAAAAAAAA==",
@@ -563,6 +970,33 @@ def tests_run() -> None:
     test_gfpoly_sqrt()
     test_gfpoly_diff()
     test_gfpoly_gcd()
+    test_gf2mul_batched()
+    test_gf128_fallback_kernel()
+    test_field_inversion()
+    test_batch_inversion()
+    test_field_square_sqrt()
+    test_gfmul_gcm()
+    test_field_element_array()
+    test_tower_field()
+    test_karatsuba_mul()
+    test_poly_square_pow()
+    test_poly_division_newton()
+    test_modulus_context()
+    test_ddf_incremental()
+    test_ddf_bsgs()
+    test_half_gcd()
+    test_polynom_packed()
+    test_polynom_memo()
+    test_poly_sort_keys()
+    test_roots()
+    test_edf_splitters()
+    test_parallel_factorization()
+    test_sff_yun()
+    test_factor_pipeline()
+    test_kernel_build_hash()
+    test_empty_polynom_mul()
+    test_makemonic_zero_leading()
+    test_gfpoly_add_paths()
     for i in range(10):
         print(i)
         gcm_crack_test()